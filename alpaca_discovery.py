@@ -40,6 +40,10 @@ class AlpacaDiscovery:
         self.running = False
         self.thread = None
         self.socket = None
+        
+        # Encoded response, rebuilt only when the device list changes
+        self._response_devices = None
+        self._response_bytes = None
     
     def start(self):
         """Start the discovery service in a background thread"""
@@ -103,6 +107,41 @@ class AlpacaDiscovery:
             if self.socket:
                 self.socket.close()
     
+    def _build_response(self, devices):
+        """
+        Encode the discovery response for a device list
+        
+        Args:
+            devices: Device list as returned by get_devices_callback
+        
+        Returns:
+            UTF-8 encoded JSON response
+        """
+        response = {
+            "AlpacaPort": self.alpaca_port
+        }
+        
+        # Add server identification (optional but helpful)
+        if self.server_info:
+            response["ServerName"] = self.server_info.get('server_name', 'Unknown')
+            response["Manufacturer"] = self.server_info.get('manufacturer', 'Unknown')
+            response["ManufacturerVersion"] = self.server_info.get('manufacturer_version', '1.0')
+            response["Location"] = self.server_info.get('location', 'Unknown')
+        
+        # Add device list in Alpaca format
+        # Note: Some clients expect this format, others expect full device objects
+        response["AlpacaDevices"] = [
+            {
+                "DeviceName": device.get('DeviceName', 'Unknown'),
+                "DeviceType": device.get('DeviceType', 'Unknown'),
+                "DeviceNumber": device.get('DeviceNumber', 0),
+                "UniqueID": device.get('UniqueID', '')
+            }
+            for device in devices
+        ]
+        
+        return json.dumps(response).encode('utf-8')
+    
     def _send_discovery_response(self, addr):
         """
         Send discovery response to client
@@ -114,39 +153,17 @@ class AlpacaDiscovery:
             # Get current device list
             devices = self.get_devices()
             
-            # Build response
-            response = {
-                "AlpacaPort": self.alpaca_port
-            }
-            
-            # Add server identification (optional but helpful)
-            if self.server_info:
-                response["ServerName"] = self.server_info.get('server_name', 'Unknown')
-                response["Manufacturer"] = self.server_info.get('manufacturer', 'Unknown')
-                response["ManufacturerVersion"] = self.server_info.get('manufacturer_version', '1.0')
-                response["Location"] = self.server_info.get('location', 'Unknown')
-            
-            # Add device list in Alpaca format
-            # Note: Some clients expect this format, others expect full device objects
-            alpaca_devices = []
-            for device in devices:
-                alpaca_devices.append({
-                    "DeviceName": device.get('DeviceName', 'Unknown'),
-                    "DeviceType": device.get('DeviceType', 'Unknown'),
-                    "DeviceNumber": device.get('DeviceNumber', 0),
-                    "UniqueID": device.get('UniqueID', '')
-                })
-            
-            response["AlpacaDevices"] = alpaca_devices
-            
-            # Convert to JSON
-            response_json = json.dumps(response)
+            # The server replaces the list object when devices change, so
+            # identity is enough to know the cached bytes are still valid
+            if devices is not self._response_devices:
+                self._response_bytes = self._build_response(devices)
+                self._response_devices = devices
             
             # Send response back to requester
-            self.socket.sendto(response_json.encode('utf-8'), addr)
+            self.socket.sendto(self._response_bytes, addr)
             
-            logger.info(f"Sent discovery response to {addr[0]}:{addr[1]} with {len(alpaca_devices)} devices")
-            logger.debug(f"Response: {response_json}")
+            logger.info(f"Sent discovery response to {addr[0]}:{addr[1]} with {len(devices)} devices")
+            logger.debug(f"Response: {self._response_bytes!r}")
             
         except Exception as e:
             logger.error(f"Error sending discovery response: {e}")
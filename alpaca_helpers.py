@@ -2,30 +2,111 @@
 Helper functions for ASCOM Alpaca API
 """
 
-from flask import jsonify, request
-from functools import wraps
+from flask import Response, abort, current_app, g, request
+from werkzeug.http import unquote_etag
+from concurrent.futures import Future
+from datetime import datetime, timezone
+from functools import lru_cache, wraps
+from threading import Lock
+import itertools
+import json
+import math
+import struct
+import time
+import zlib
+from urllib.parse import parse_qsl
+import numpy as np
 import config
 
-# Global server transaction counter
-_server_transaction_id = 0
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# Response envelope - filled in per request, no dict is built
+_ENVELOPE = (b'{"ClientTransactionID":%d,"ServerTransactionID":%d,'
+             b'"ErrorNumber":%d,"ErrorMessage":%s%s}')
+_VALUE_KEY = b',"Value":'
+
+if ORJSON_AVAILABLE:
+    encode_json = orjson.dumps
+elif MSGSPEC_AVAILABLE:
+    encode_json = msgspec.json.encode
+else:
+    def encode_json(value):
+        """Encode a value as compact JSON bytes"""
+        return json.dumps(value, separators=(',', ':')).encode('utf-8')
+
+class EncodedJSON(bytes):
+    """A Value that is already JSON-encoded and is sent verbatim"""
+
+def prebuilt_value(value):
+    """Encode a constant Value once so responses can reuse the bytes"""
+    return EncodedJSON(encode_json(value))
+
+# Error messages may be prebuilt the same way; the success case is the
+# empty message
+_NO_ERROR_MESSAGE = prebuilt_value("")
+
+# Global server transaction counter (next() on a count is atomic under the GIL)
+_server_transaction_ids = itertools.count(1)
 
 def get_next_transaction_id():
     """Get next server transaction ID"""
-    global _server_transaction_id
-    _server_transaction_id += 1
-    return _server_transaction_id
+    return next(_server_transaction_ids)
+
+# Upper bound on parameters parsed from a PUT body (Alpaca sends a handful)
+MAX_FORM_FIELDS = 16
+
+def get_request_params():
+    """
+    Get the Alpaca parameters of the current request as a mapping
+    
+    GET parameters come from the query string. A PUT body is parsed once
+    per request with parse_qsl (at most MAX_FORM_FIELDS fields) rather
+    than Werkzeug's multipart-aware form parser; JSON bodies are accepted
+    too. A body with more fields than that is rejected with 400.
+    """
+    params = g.get('alpaca_params')
+    if params is None:
+        if request.method == 'GET':
+            params = request.args
+        elif request.is_json:
+            params = request.get_json(silent=True) or {}
+        else:
+            try:
+                params = dict(parse_qsl(request.get_data(as_text=True),
+                                        max_num_fields=MAX_FORM_FIELDS))
+            except ValueError:
+                abort(400)
+        g.alpaca_params = params
+    return params
 
 def get_client_transaction_id():
     """Extract client transaction ID from request"""
-    if request.method == 'GET':
-        return int(request.args.get('ClientTransactionID', 0))
-    else:
-        data = request.form if request.form else request.json
-        if data:
-            return int(data.get('ClientTransactionID', 0))
+    try:
+        return int(get_request_params().get('ClientTransactionID', 0))
+    except (ValueError, TypeError):
         return 0
 
-def alpaca_response(value=None, client_id=None, error_number=0, error_message=""):
+# Tagged responses may be stored but must be revalidated with If-None-Match,
+# since the body carries per-request transaction IDs
+_TAGGED_CACHE_CONTROL = 'no-cache'
+
+def alpaca_response(value=None, client_id=None, error_number=0, error_message=_NO_ERROR_MESSAGE, etag=False):
     """
     Format standard ASCOM Alpaca response
     
@@ -33,22 +114,268 @@ def alpaca_response(value=None, client_id=None, error_number=0, error_message=""
         value: The return value (omitted if None)
         client_id: Client transaction ID (auto-detected if None)
         error_number: ASCOM error code
-        error_message: Error description
+        error_message: Error description (str or prebuilt_value())
+        etag: Tag the response for conditional GET (for values that rarely
+              change, e.g. capabilities, driver info and site settings)
+    """
+    if etag:
+        tag = make_etag(value)
+        # Weak comparison against every tag the client listed (or '*')
+        if request.if_none_match.contains_weak(unquote_etag(tag)[0]):
+            return Response(status=304, headers={'ETag': tag, 'Cache-Control': _TAGGED_CACHE_CONTROL})
+    
+    if client_id is None:
+        client_id = get_client_transaction_id()
+    
+    body = _ENVELOPE % (
+        int(client_id),
+        get_next_transaction_id(),
+        error_number,
+        error_message if type(error_message) is EncodedJSON else encode_json(error_message),
+        _encode_value(value)
+    )
+    
+    response = Response(body, mimetype='application/json')
+    if etag:
+        response.headers['ETag'] = tag
+        response.headers['Cache-Control'] = _TAGGED_CACHE_CONTROL
+    return response
+
+def _encode_value(value):
+    """Encode the optional Value member of the envelope"""
+    if value is None:
+        return b''
+    if type(value) is EncodedJSON:
+        return _VALUE_KEY + value
+    return _VALUE_KEY + encode_json(value)
+
+def make_etag(value):
+    """Build a weak ETag from the request path and the returned value"""
+    try:
+        return _etag_for(request.path, value)
+    except TypeError:
+        # Unhashable value - compute it without the memo
+        return _etag_for.__wrapped__(request.path, value)
+
+@lru_cache(maxsize=256, typed=True)
+def _etag_for(path, value):
+    """
+    ETag for one (path, value) pair
+    
+    Derived from the value itself, so a setting changed by a PUT gets a
+    new tag with no bookkeeping. Tagged routes return few distinct values,
+    which keeps the memo small.
+    """
+    return 'W/"%08x"' % zlib.crc32(f"{path}:{value!r}".encode('utf-8'))
+
+# Error codes used by the endpoint decorators
+_ERR_NOT_IMPLEMENTED = config.ASCOM_ERROR_CODES['NOT_IMPLEMENTED']
+_ERR_NOT_CONNECTED = config.ASCOM_ERROR_CODES['NOT_CONNECTED']
+_ERR_INVALID_OPERATION = config.ASCOM_ERROR_CODES['INVALID_OPERATION']
+
+# ImageBytes (application/imagebytes) transfer
+IMAGEBYTES_MIMETYPE = 'application/imagebytes'
+# Int32 fields except the two transaction IDs, which are UInt32 - wrapped
+# into range with UINT32_MASK, as the JSON envelope accepts any integer
+IMAGEBYTES_HEADER = struct.Struct('<2i2I7i')
+UINT32_MASK = 0xFFFFFFFF
+IMAGEBYTES_BLOCK_SIZE = 1 << 20        # Bytes of pixel data per streamed chunk
+IMAGE_ELEMENT_INT32 = 2
+IMAGE_ELEMENT_UINT16 = 8
+
+def accepts_imagebytes():
+    """Check if the client asked for the ImageBytes binary format"""
+    return IMAGEBYTES_MIMETYPE in request.headers.get('Accept', '')
+
+def imagebytes_response(img, client_id=None):
+    """
+    Stream a 2D UInt16 image in the Alpaca ImageBytes format
+    
+    The 44-byte header and the pixel data go out as separate chunks. Pixels
+    are sent x-major (ASCOM [x][y] order), so the (height, width) frame is
+    transposed one block of columns at a time rather than copied whole.
+    
+    Args:
+        img: 2D numpy array, shape (height, width)
+        client_id: Client transaction ID (auto-detected if None)
+    """
+    if client_id is None:
+        client_id = get_client_transaction_id()
+    
+    height, width = img.shape
+    header = IMAGEBYTES_HEADER.pack(
+        1,                          # MetadataVersion
+        0,                          # ErrorNumber
+        int(client_id) & UINT32_MASK,
+        get_next_transaction_id() & UINT32_MASK,
+        IMAGEBYTES_HEADER.size,     # DataStart
+        IMAGE_ELEMENT_INT32,        # ImageElementType
+        IMAGE_ELEMENT_UINT16,       # TransmissionElementType
+        2,                          # Rank
+        width,
+        height,
+        0
+    )
+    columns = max(1, IMAGEBYTES_BLOCK_SIZE // (height * 2))
+    
+    def generate():
+        yield header
+        for x in range(0, width, columns):
+            block = np.ascontiguousarray(img[:, x:x + columns].T, dtype='<u2')
+            yield memoryview(block).cast('B')
+    
+    return Response(
+        generate(),
+        mimetype=IMAGEBYTES_MIMETYPE,
+        headers={'Content-Length': str(IMAGEBYTES_HEADER.size + width * height * 2)},
+        direct_passthrough=True
+    )
+
+def imagebytes_error(error_number, error_message, client_id=None):
+    """
+    ImageBytes error response for clients that asked for ImageBytes
+    
+    The header carries the error number with zero element types, rank and
+    dimensions; the UTF-8 message follows as the data.
     """
     if client_id is None:
         client_id = get_client_transaction_id()
     
-    response = {
-        "ClientTransactionID": int(client_id),
-        "ServerTransactionID": get_next_transaction_id(),
-        "ErrorNumber": error_number,
-        "ErrorMessage": error_message
-    }
+    header = IMAGEBYTES_HEADER.pack(
+        1,                          # MetadataVersion
+        error_number,
+        int(client_id) & UINT32_MASK,
+        get_next_transaction_id() & UINT32_MASK,
+        IMAGEBYTES_HEADER.size,     # DataStart
+        0, 0, 0, 0, 0, 0
+    )
+    return Response(header + error_message.encode('utf-8'), mimetype=IMAGEBYTES_MIMETYPE)
+
+# JSON ImageArray transfer
+IMAGEARRAY_BLOCK_COLUMNS = 64          # Image columns encoded per streamed chunk
+
+if ORJSON_AVAILABLE:
+    def _encode_columns(columns):
+        """Encode a block of image columns straight from the numpy buffer"""
+        return orjson.dumps(np.ascontiguousarray(columns.T), option=orjson.OPT_SERIALIZE_NUMPY)
+else:
+    def _encode_columns(columns):
+        """Encode a block of image columns"""
+        return encode_json(columns.T.tolist())
+
+def imagearray_response(img, client_id=None):
+    """
+    Stream a 2D image as a JSON ImageArray response
+    
+    Value is indexed [x][y] (ASCOM order, as in ImageBytes). Columns are
+    encoded a block at a time, so the frame is never turned into one big
+    Python list and the body goes out chunked as it is produced.
+    
+    Args:
+        img: 2D numpy array, shape (height, width)
+        client_id: Client transaction ID (auto-detected if None)
+    """
+    if client_id is None:
+        client_id = get_client_transaction_id()
     
-    if value is not None:
-        response["Value"] = value
+    # Envelope up to the opening bracket of Value - the closing '}' is
+    # dropped here and sent after the last row
+    head = (_ENVELOPE % (
+        int(client_id),
+        get_next_transaction_id(),
+        0,
+        b'""',
+        _VALUE_KEY + b'['
+    ))[:-1]
+    width = img.shape[1]
     
-    return jsonify(response)
+    def generate():
+        yield head
+        for x in range(0, width, IMAGEARRAY_BLOCK_COLUMNS):
+            columns = _encode_columns(img[:, x:x + IMAGEARRAY_BLOCK_COLUMNS])[1:-1]
+            yield columns if x == 0 else b',' + columns
+        yield b']}'
+    
+    return Response(generate(), mimetype='application/json')
+
+# gzip for the large JSON image bodies (level 1 keeps it cheap on a Pi)
+GZIP_LEVEL = 1
+
+def accepts_gzip():
+    """Check if the client accepts a gzip-encoded body"""
+    return 'gzip' in request.headers.get('Accept-Encoding', '')
+
+def gzip_response(response):
+    """
+    Gzip a response body on the fly if the client accepts it
+    
+    Works on streamed bodies chunk by chunk. Meant for the JSON image
+    routes only - small envelopes are not worth compressing.
+    """
+    if not accepts_gzip():
+        return response
+    
+    chunks = response.response
+    
+    def generate():
+        compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        for chunk in chunks:
+            data = compressor.compress(chunk)
+            if data:
+                yield data
+        yield compressor.flush()
+    
+    response.response = generate()
+    response.headers.pop('Content-Length', None)
+    response.headers['Content-Encoding'] = 'gzip'
+    response.headers['Vary'] = 'Accept-Encoding'
+    return response
+
+# zstd for the same bodies when the client offers it (faster than gzip at
+# a similar ratio)
+ZSTD_LEVEL = 1
+
+def accepts_zstd():
+    """Check if the client accepts a zstd-encoded body"""
+    return ZSTD_AVAILABLE and 'zstd' in request.headers.get('Accept-Encoding', '')
+
+def zstd_response(response):
+    """Zstd-compress a (streamed) response body chunk by chunk"""
+    chunks = response.response
+    
+    def generate():
+        compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+        for chunk in chunks:
+            data = compressor.compress(chunk)
+            if data:
+                yield data
+        yield compressor.flush()
+    
+    response.response = generate()
+    response.headers.pop('Content-Length', None)
+    response.headers['Content-Encoding'] = 'zstd'
+    response.headers['Vary'] = 'Accept-Encoding'
+    return response
+
+def compress_response(response):
+    """Compress a JSON image response with zstd or gzip, whichever the client accepts"""
+    if accepts_zstd():
+        return zstd_response(response)
+    return gzip_response(response)
+
+def device_state(properties):
+    """
+    Build the Value of a DeviceState response
+    
+    Args:
+        properties: Mapping of Alpaca property name -> current value
+    
+    Returns:
+        list: {"Name", "Value"} entries, ending with the TimeStamp entry
+    """
+    state = [{'Name': name, 'Value': value} for name, value in properties.items()]
+    state.append({'Name': 'TimeStamp', 'Value': datetime.now(timezone.utc).isoformat()})
+    return state
 
 def alpaca_error(error_code, error_message, client_id=None):
     """Create an Alpaca error response"""
@@ -59,10 +386,20 @@ def alpaca_error(error_code, error_message, client_id=None):
         error_message=error_message
     )
 
+# Messages for the decorators' error paths, encoded once
+_MSG_DEVICE_NOT_AVAILABLE = prebuilt_value("Device not available")
+_MSG_DEVICE_NOT_CONNECTED = prebuilt_value("Device is not connected")
+_MSG_CAMERA_NOT_FOUND = prebuilt_value("Camera not found")
+_MSG_CAMERA_NOT_CONNECTED = prebuilt_value("Camera not connected")
+_MSG_CAMERA_BUSY = prebuilt_value("Camera busy with another command")
+
 def require_connected(device_attr):
     """
     Decorator to check if device is connected before executing endpoint
     
+    The connected case is a single read of the device's plain is_connected
+    flag; the error responses are only built on the cold path.
+    
     Args:
         device_attr: Name of the device attribute (e.g., 'telescope', 'camera')
     """
@@ -70,22 +407,192 @@ def require_connected(device_attr):
         @wraps(func)
         def wrapper(*args, **kwargs):
             # Get device from the app context
-            from flask import current_app
             device = getattr(current_app, device_attr, None)
+            if device is not None and device.is_connected:
+                return func(*args, **kwargs)
             
             if device is None:
-                return alpaca_error(
-                    config.ASCOM_ERROR_CODES['NOT_IMPLEMENTED'],
-                    "Device not available"
-                )
+                return alpaca_error(_ERR_NOT_IMPLEMENTED, _MSG_DEVICE_NOT_AVAILABLE)
+            return alpaca_error(_ERR_NOT_CONNECTED, _MSG_DEVICE_NOT_CONNECTED)
+        return wrapper
+    return decorator
+
+def require_device(device_attr, error_message="Device not available"):
+    """
+    Decorator to check a device exists, connected or not
+    
+    For endpoints that must work while disconnected (Connected itself,
+    driver info, target coordinates). The error message is encoded once
+    here rather than on every miss.
+    
+    Args:
+        device_attr: Name of the device attribute (e.g., 'telescope')
+        error_message: ErrorMessage returned when the device is missing
+    """
+    message = prebuilt_value(error_message)
+    
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if getattr(current_app, device_attr, None) is not None:
+                return func(*args, **kwargs)
+            return alpaca_error(_ERR_NOT_IMPLEMENTED, message)
+        return wrapper
+    return decorator
+
+def require_camera_connected(func):
+    """
+    Decorator for camera endpoints taking a device_number
+    
+    Looks the camera up, checks it is connected and passes it to the
+    endpoint as the second argument: func(device_number, camera).
+    """
+    @wraps(func)
+    def wrapper(device_number, *args, **kwargs):
+        try:
+            camera = current_app.cameras[device_number]
+        except IndexError:
+            camera = None
+        
+        if camera is not None and camera.is_connected:
+            return func(device_number, camera, *args, **kwargs)
+        
+        if camera is None:
+            return alpaca_error(_ERR_NOT_IMPLEMENTED, _MSG_CAMERA_NOT_FOUND)
+        return alpaca_error(_ERR_NOT_CONNECTED, _MSG_CAMERA_NOT_CONNECTED)
+    return wrapper
+
+def require_camera(func):
+    """
+    Decorator for camera endpoints that work without a connection
+    
+    Like require_camera_connected() but only checks that the camera
+    exists, e.g. for Connected itself and the driver descriptions.
+    """
+    @wraps(func)
+    def wrapper(device_number, *args, **kwargs):
+        try:
+            camera = current_app.cameras[device_number]
+        except IndexError:
+            camera = None
+        
+        if camera is not None:
+            return func(device_number, camera, *args, **kwargs)
+        return alpaca_error(_ERR_NOT_IMPLEMENTED, _MSG_CAMERA_NOT_FOUND)
+    return wrapper
+
+# Seconds a camera PUT waits for the one before it on the same camera
+CAMERA_WRITE_TIMEOUT = 2.0
+
+_camera_write_locks = {}    # device_number -> Lock held by the running PUT
+_camera_write_locks_lock = Lock()
+
+def camera_write(func):
+    """
+    Decorator to run camera PUTs one at a time per camera
+    
+    Goes below require_camera_connected(). A PUT that cannot start within
+    CAMERA_WRITE_TIMEOUT gets an error instead of parking another request
+    thread behind a stalled USB link.
+    """
+    @wraps(func)
+    def wrapper(device_number, *args, **kwargs):
+        write_lock = _camera_write_locks.get(device_number)
+        if write_lock is None:
+            with _camera_write_locks_lock:
+                write_lock = _camera_write_locks.setdefault(device_number, Lock())
+        
+        if not write_lock.acquire(timeout=CAMERA_WRITE_TIMEOUT):
+            return alpaca_error(_ERR_INVALID_OPERATION, _MSG_CAMERA_BUSY)
+        try:
+            return func(device_number, *args, **kwargs)
+        finally:
+            write_lock.release()
+    return wrapper
+
+def single_flight(timeout=5.0):
+    """
+    Decorator to coalesce concurrent identical calls
+    
+    While one caller is running the function, others calling it with the
+    same arguments wait for that result instead of repeating the device I/O.
+    Nothing is cached once the call completes.
+    
+    Args:
+        timeout: Seconds a waiting caller waits for the running call
+    """
+    def decorator(func):
+        inflight = {}       # args -> Future of the running call
+        lock = Lock()
+        
+        @wraps(func)
+        def wrapper(*args):
+            with lock:
+                future = inflight.get(args)
+                owner = future is None
+                if owner:
+                    future = Future()
+                    inflight[args] = future
+            
+            if not owner:
+                return future.result(timeout=timeout)
+            
+            try:
+                result = func(*args)
+                future.set_result(result)
+                return result
+            except Exception as e:
+                future.set_exception(e)
+                raise
+            finally:
+                with lock:
+                    del inflight[args]
+        return wrapper
+    return decorator
+
+def ttl_cache(ttl_seconds):
+    """
+    Decorator to cache a function's result for a short time
+    
+    Concurrent callers with the same arguments share one call (single-flight)
+    instead of each going to the device. Call func.cache_clear() to drop
+    cached values, e.g. after a command that changes them.
+    
+    Args:
+        ttl_seconds: How long a result stays valid
+    """
+    def decorator(func):
+        cache = {}          # args -> (value, expiry)
+        call_locks = {}     # args -> Lock held while the call is in flight
+        locks_lock = Lock()
+        generation = [0]    # Bumped by cache_clear() to discard in-flight results
+        
+        @wraps(func)
+        def wrapper(*args):
+            entry = cache.get(args)
+            if entry is not None and entry[1] > time.monotonic():
+                return entry[0]
             
-            if not device.is_connected:
-                return alpaca_error(
-                    config.ASCOM_ERROR_CODES['NOT_CONNECTED'],
-                    "Device is not connected"
-                )
+            with locks_lock:
+                call_lock = call_locks.setdefault(args, Lock())
             
-            return func(*args, **kwargs)
+            with call_lock:
+                # Another caller may have refreshed it while we waited
+                entry = cache.get(args)
+                if entry is not None and entry[1] > time.monotonic():
+                    return entry[0]
+                
+                started = generation[0]
+                value = func(*args)
+                if generation[0] == started:
+                    cache[args] = (value, time.monotonic() + ttl_seconds)
+                return value
+        
+        def cache_clear():
+            generation[0] += 1
+            cache.clear()
+        
+        wrapper.cache_clear = cache_clear
         return wrapper
     return decorator
 
@@ -98,8 +605,8 @@ def get_form_value(key, default=None, value_type=str):
         default: Default value if not found
         value_type: Type to convert to (str, int, float, bool)
     """
-    data = request.form if request.form else request.json
-    if not data or key not in data:
+    data = get_request_params()
+    if key not in data:
         return default
     
     value = data.get(key)
@@ -114,6 +621,44 @@ def get_form_value(key, default=None, value_type=str):
     else:
         return value
 
+# Accepted spellings of Alpaca boolean parameters
+_BOOL_VALUES = {
+    'true': True, '1': True, 'yes': True,
+    'false': False, '0': False, 'no': False
+}
+
+def make_form_getter(key, default=None, value_type=str):
+    """
+    Build a reader for a single PUT parameter
+    
+    Same conversion rules as get_form_value(), but the key, default and
+    converter are fixed once so each call only does the lookup.
+    
+    Args:
+        key: Parameter name
+        default: Default value if missing or invalid
+        value_type: Type to convert to (str, int, float, bool)
+    """
+    if value_type == bool:
+        def convert(value):
+            return _BOOL_VALUES.get(str(value).lower(), False)
+    elif value_type in (int, float):
+        def convert(value):
+            try:
+                return value_type(value)
+            except (ValueError, TypeError):
+                return default
+    else:
+        def convert(value):
+            return value
+    
+    def get():
+        data = get_request_params()
+        if key not in data:
+            return default
+        return convert(data.get(key))
+    return get
+
 def parse_device_number(device_type, device_number):
     """
     Validate device number against configuration
@@ -171,15 +716,26 @@ def parse_dec_to_degrees(dec_string):
     except (ValueError, IndexError):
         return 0.0
 
-def validate_range(value, min_val, max_val, param_name):
+def validate_range(value, min_val, max_val, param_name, max_inclusive=True):
     """
     Validate value is within range
     
+    Non-finite values (NaN, infinity) are always rejected.
+    
+    Args:
+        max_inclusive: False for a half-open range [min_val, max_val), e.g.
+                       RA hours or azimuth degrees, where max_val wraps to 0
+    
     Returns:
         tuple: (is_valid, error_message)
     """
-    if value < min_val or value > max_val:
-        return False, f"{param_name} must be between {min_val} and {max_val}"
+    if not math.isfinite(value):
+        return False, f"{param_name} must be a finite number"
+    if max_inclusive:
+        if value < min_val or value > max_val:
+            return False, f"{param_name} must be between {min_val} and {max_val}"
+    elif value < min_val or value >= max_val:
+        return False, f"{param_name} must be at least {min_val} and less than {max_val}"
     return True, None
 
 def clamp(value, min_val, max_val):
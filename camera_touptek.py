@@ -3,10 +3,13 @@ ToupTek Camera Driver
 Implements ASCOM ICameraV4 interface
 """
 
+import ctypes
 import time
+import weakref
 import numpy as np
 from threading import Lock, Thread
 from enum import IntEnum
+import alpaca_helpers as helpers
 
 try:
     from toupcam import Toupcam as toupcam
@@ -14,6 +17,17 @@ try:
 except ImportError:
     TOUPTEK_AVAILABLE = False
 
+# Attached cameras are re-enumerated at most this often (seconds)
+ENUMERATION_TTL = 5.0
+
+# Sensor temperature is polled in the background this often (seconds)
+TEMPERATURE_POLL_INTERVAL = 0.5
+
+@helpers.ttl_cache(ENUMERATION_TTL)
+def list_cameras():
+    """Attached ToupTek cameras, cached briefly across reconnects"""
+    return toupcam.Toupcam.EnumV2()
+
 class CameraStates(IntEnum):
     cameraIdle = 0
     cameraWaiting = 1
@@ -47,6 +61,9 @@ class ToupTekCamera:
         self.camera_state = CameraStates.cameraIdle
         self.image_ready = False
         self.image_array = None
+        self._frame_raw = None    # Download buffer, reused when no longer read
+        self._frame_buf = None    # uint16 (height, width) view of _frame_raw
+        self._frame_views = []    # Weak refs to views of _frame_buf handed out
         self.last_exposure_duration = 0
         self.last_exposure_start_time = None
         self.percent_completed = 0
@@ -107,7 +124,12 @@ class ToupTekCamera:
         self.is_connecting = True
         try:
             # Enumerate cameras
-            arr = toupcam.Toupcam.EnumV2()
+            arr = list_cameras()
+            if self.camera_id >= len(arr):
+                # Cached list may predate a hot-plug - enumerate live once
+                list_cameras.cache_clear()
+                arr = list_cameras()
+            
             if len(arr) == 0:
                 raise RuntimeError("No ToupTek cameras found")
             
@@ -150,6 +172,7 @@ class ToupTekCamera:
                 self.can_set_ccd_temperature = False
             
             self.is_connected = True
+            self._start_temperature_poll()
             print(f"Connected to {self.sensor_name}")
             return True
             
@@ -177,13 +200,12 @@ class ToupTekCamera:
                 # Get image dimensions
                 width, height = self.camera.PullImageV2(None, 16, None)
                 
-                # Allocate buffer
-                buf = bytes(width * height * 2)  # 16-bit
-                self.camera.PullImageV2(buf, 16, None)
-                
-                # Convert to numpy array
+                # Pull straight into the reused frame buffer (16-bit)
                 with self.lock:
-                    self.image_array = np.frombuffer(buf, dtype=np.uint16).reshape((height, width))
+                    frame = self._ensure_buf(height, width)
+                    raw = (ctypes.c_char * len(self._frame_raw)).from_buffer(self._frame_raw)
+                    self.camera.PullImageV2(raw, 16, None)
+                    self.image_array = frame
                     
                     self.image_ready = True
                     self.camera_state = CameraStates.cameraIdle
@@ -258,19 +280,71 @@ class ToupTekCamera:
         with self.lock:
             return self.image_array.copy()
     
+    def get_image_buffer(self):
+        """
+        Get the image without copying it
+        
+        Returns a view of the camera's frame buffer. While any such view is
+        alive (e.g. a response still streaming it) the next download goes
+        to a new buffer, so the frame never changes under its reader.
+        """
+        with self.lock:
+            if not self.image_ready or self.image_array is None:
+                raise RuntimeError("No image available")
+            
+            view = self.image_array.view()
+            self._frame_views = [ref for ref in self._frame_views if ref() is not None]
+            self._frame_views.append(weakref.ref(view))
+            return view
+    
+    def _ensure_buf(self, height, width):
+        """
+        Return a buffer to download the next frame into
+        
+        The current one is reused unless the ROI changed or a view handed
+        out by get_image_buffer() is still alive. Call with the lock held.
+        """
+        if (self._frame_buf is None or self._frame_buf.shape != (height, width)
+                or any(ref() is not None for ref in self._frame_views)):
+            self._frame_raw = bytearray(height * width * 2)
+            self._frame_buf = np.frombuffer(self._frame_raw, dtype=np.uint16).reshape((height, width))
+        self._frame_views = []
+        return self._frame_buf
+    
     def pulse_guide(self, direction, duration):
         """Pulse guide (not supported)"""
         raise RuntimeError("Pulse guide not supported on ToupTek cameras")
     
+    def _start_temperature_poll(self):
+        """Start the background thread that keeps the temperature current"""
+        Thread(target=self._temperature_loop, args=(self.camera,), daemon=True).start()
+    
+    def _temperature_loop(self, handle):
+        """Poll the sensor until disconnected (or reconnected with a new handle)"""
+        while self.is_connected and self.camera is handle:
+            self.update_temperature()
+            time.sleep(TEMPERATURE_POLL_INTERVAL)
+    
     def update_temperature(self):
-        """Update temperature readings"""
-        if self.camera and self.is_connected and self.can_set_ccd_temperature:
-            try:
-                temp = self.camera.get_Temperature()
-                if temp is not None:
-                    self.ccd_temperature = temp / 10.0  # Convert to celsius
-            except:
-                pass
+        """
+        Update temperature readings
+        
+        Skipped (keeping the last reading) while an exposure start or image
+        download holds the camera lock, rather than calling the SDK
+        concurrently with it or stalling behind it.
+        """
+        if not (self.camera and self.is_connected and self.can_set_ccd_temperature):
+            return
+        if not self.lock.acquire(blocking=False):
+            return
+        try:
+            temp = self.camera.get_Temperature()
+            if temp is not None:
+                self.ccd_temperature = temp / 10.0  # Convert to celsius
+        except Exception as e:
+            print(f"Temperature read error: {e}")
+        finally:
+            self.lock.release()
     
     def set_cooler(self, enabled):
         """Enable/disable cooler (if supported)"""
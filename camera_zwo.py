@@ -4,9 +4,11 @@ Implements ASCOM ICameraV4 interface
 """
 
 import time
+import weakref
 import numpy as np
 from threading import Lock, Thread
 from enum import IntEnum
+import alpaca_helpers as helpers
 
 try:
     import zwoasi as asi
@@ -14,6 +16,17 @@ try:
 except ImportError:
     ZWO_AVAILABLE = False
 
+# Attached cameras are re-enumerated at most this often (seconds)
+ENUMERATION_TTL = 5.0
+
+# Sensor temperature is polled in the background this often (seconds)
+TEMPERATURE_POLL_INTERVAL = 0.5
+
+@helpers.ttl_cache(ENUMERATION_TTL)
+def count_cameras():
+    """Number of attached ZWO cameras, cached briefly across reconnects"""
+    return asi.get_num_cameras()
+
 class CameraStates(IntEnum):
     cameraIdle = 0
     cameraWaiting = 1
@@ -48,6 +61,9 @@ class ZWOCamera:
         self.camera_state = CameraStates.cameraIdle
         self.image_ready = False
         self.image_array = None
+        self._frame_raw = None    # Download buffer, reused when no longer read
+        self._frame_buf = None    # uint16 (height, width) view of _frame_raw
+        self._frame_views = []    # Weak refs to views of _frame_buf handed out
         self.last_exposure_duration = 0
         self.last_exposure_start_time = None
         self.percent_completed = 0
@@ -110,7 +126,12 @@ class ZWOCamera:
             # Initialize SDK
             asi.init(self.sdk_path)
             
-            num_cameras = asi.get_num_cameras()
+            num_cameras = count_cameras()
+            if self.camera_id >= num_cameras:
+                # Cached list may predate a hot-plug - enumerate live once
+                count_cameras.cache_clear()
+                num_cameras = count_cameras()
+            
             if num_cameras == 0:
                 raise RuntimeError("No ZWO cameras found")
             
@@ -166,6 +187,7 @@ class ZWOCamera:
             self.can_pulse_guide = camera_info.get('ST4Port', False)
             
             self.is_connected = True
+            self._start_temperature_poll()
             print(f"Connected to {self.sensor_name}")
             return True
             
@@ -257,14 +279,14 @@ class ZWOCamera:
                 self.camera_state = CameraStates.cameraDownload
                 
                 with self.lock:
-                    # Get image data
-                    img = self.camera.get_data_after_exposure()
                     whbi = self.camera.get_roi_format()
-                    
-                    # Reshape to 2D array
                     width = whbi[0]
                     height = whbi[1]
-                    self.image_array = np.frombuffer(img, dtype=np.uint16).reshape((height, width))
+                    
+                    # Download straight into the reused frame buffer
+                    frame = self._ensure_buf(height, width)
+                    self.camera.get_data_after_exposure(self._frame_raw)
+                    self.image_array = frame
                     
                     self.image_ready = True
                     self.camera_state = CameraStates.cameraIdle
@@ -297,6 +319,37 @@ class ZWOCamera:
         with self.lock:
             return self.image_array.copy()
     
+    def get_image_buffer(self):
+        """
+        Get the image without copying it
+        
+        Returns a view of the camera's frame buffer. While any such view is
+        alive (e.g. a response still streaming it) the next download goes
+        to a new buffer, so the frame never changes under its reader.
+        """
+        with self.lock:
+            if not self.image_ready or self.image_array is None:
+                raise RuntimeError("No image available")
+            
+            view = self.image_array.view()
+            self._frame_views = [ref for ref in self._frame_views if ref() is not None]
+            self._frame_views.append(weakref.ref(view))
+            return view
+    
+    def _ensure_buf(self, height, width):
+        """
+        Return a buffer to download the next frame into
+        
+        The current one is reused unless the ROI changed or a view handed
+        out by get_image_buffer() is still alive. Call with the lock held.
+        """
+        if (self._frame_buf is None or self._frame_buf.shape != (height, width)
+                or any(ref() is not None for ref in self._frame_views)):
+            self._frame_raw = bytearray(height * width * 2)
+            self._frame_buf = np.frombuffer(self._frame_raw, dtype=np.uint16).reshape((height, width))
+        self._frame_views = []
+        return self._frame_buf
+    
     def pulse_guide(self, direction, duration):
         """Pulse guide (if ST4 port available)"""
         if not self.can_pulse_guide:
@@ -306,18 +359,39 @@ class ZWOCamera:
         # Placeholder for now
         raise RuntimeError("Pulse guide not yet implemented")
     
+    def _start_temperature_poll(self):
+        """Start the background thread that keeps the temperature current"""
+        Thread(target=self._temperature_loop, args=(self.camera,), daemon=True).start()
+    
+    def _temperature_loop(self, handle):
+        """Poll the sensor until disconnected (or reconnected with a new handle)"""
+        while self.is_connected and self.camera is handle:
+            self.update_temperature()
+            time.sleep(TEMPERATURE_POLL_INTERVAL)
+    
     def update_temperature(self):
-        """Update temperature readings"""
-        if self.camera and self.is_connected:
-            try:
-                temp = self.camera.get_control_value(asi.ASI_TEMPERATURE)[0] / 10.0
-                self.ccd_temperature = temp
-                
-                if self.can_get_cooler_power:
-                    power = self.camera.get_control_value(asi.ASI_COOLER_POWER_PERC)[0]
-                    self.cooler_power = power
-            except:
-                pass
+        """
+        Update temperature readings
+        
+        Skipped (keeping the last reading) while an exposure start or image
+        download holds the camera lock, rather than calling the SDK
+        concurrently with it or stalling behind it.
+        """
+        if not (self.camera and self.is_connected):
+            return
+        if not self.lock.acquire(blocking=False):
+            return
+        try:
+            temp = self.camera.get_control_value(asi.ASI_TEMPERATURE)[0] / 10.0
+            self.ccd_temperature = temp
+            
+            if self.can_get_cooler_power:
+                power = self.camera.get_control_value(asi.ASI_COOLER_POWER_PERC)[0]
+                self.cooler_power = power
+        except Exception as e:
+            print(f"Temperature read error: {e}")
+        finally:
+            self.lock.release()
     
     def set_cooler(self, enabled):
         """Enable/disable cooler"""
@@ -7,6 +7,9 @@ Complete configuration with all devices
 SERVER_HOST = '0.0.0.0'
 SERVER_PORT = 5555
 DEBUG_MODE = False
+HTTP_THREADS = 16            # Worker threads when served by waitress
+HTTP_CONNECTION_LIMIT = 256
+HTTP_MAX_CONTENT_LENGTH = 16 * 1024  # Largest accepted request body (bytes)
 
 # Discovery Configuration
 DISCOVERY_ENABLED = True
@@ -63,6 +66,9 @@ TELESCOPE_CONFIG = {
         #'port': 9999,
         'host': '192.168.5.140',  # ← TEST w Seestar to see if Alpaca id'd
         'port': 32323,
+        # Optional socket options as (level, option, value) tuples; when
+        # unset the driver enables TCP_NODELAY and SO_KEEPALIVE, e.g.
+        #'socket_options': [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)],
     },
     
     # SERIAL CONNECTION (USB)
@@ -9,6 +9,7 @@ import ctypes
 import os
 from threading import Lock
 from enum import IntEnum
+import alpaca_helpers as helpers
 
 # Try to import ZWO EFW SDK
 ZWO_EFW_AVAILABLE = False
@@ -107,6 +108,10 @@ class FilterWheelBase:
         
         # Focus offsets in microns (adjust for each filter)
         self.focus_offsets = [0, 0, 0, 0, 50, 30, 40, 0]
+        
+        # Per-slot lists served to clients, built on first use
+        self._names_cache = None
+        self._offsets_cache = None
     
     def connect(self):
         """Connect to filter wheel"""
@@ -138,6 +143,7 @@ class FilterWheelBase:
         """Set name of filter at position"""
         if 0 <= position < len(self.filter_names):
             self.filter_names[position] = name
+            self.invalidate_cache()
     
     def get_focus_offset(self, position):
         """Get focus offset for filter at position"""
@@ -149,6 +155,24 @@ class FilterWheelBase:
         """Set focus offset for filter at position"""
         if 0 <= position < len(self.focus_offsets):
             self.focus_offsets[position] = offset
+            self.invalidate_cache()
+    
+    def get_filter_names(self):
+        """Get names of all slots (cached until the configuration changes)"""
+        if self._names_cache is None:
+            self._names_cache = [self.get_filter_name(i) for i in range(self.slot_count)]
+        return self._names_cache
+    
+    def get_focus_offsets(self):
+        """Get focus offsets of all slots (cached until the configuration changes)"""
+        if self._offsets_cache is None:
+            self._offsets_cache = [self.get_focus_offset(i) for i in range(self.slot_count)]
+        return self._offsets_cache
+    
+    def invalidate_cache(self):
+        """Drop cached slot lists after names, offsets or slot count change"""
+        self._names_cache = None
+        self._offsets_cache = None
     
     def supported_actions(self):
         """Get list of supported Action() commands"""
@@ -212,6 +236,7 @@ class ZWOFilterWheel(FilterWheelBase):
                     self.filter_names = self.filter_names[:self.slot_count]
                 if len(self.focus_offsets) > self.slot_count:
                     self.focus_offsets = self.focus_offsets[:self.slot_count]
+                self.invalidate_cache()
             
             # Get initial position
             position = ctypes.c_int()
@@ -238,6 +263,7 @@ class ZWOFilterWheel(FilterWheelBase):
         self.is_connected = False
         self.efw_id = -1
     
+    @helpers.single_flight()
     def get_position(self):
         """Get current filter position"""
         if not self.is_connected:
@@ -8,8 +8,9 @@ Includes backlash compensation
 import time
 import ctypes
 import os
-from threading import Lock
+from threading import Lock, Thread
 from enum import IntEnum
+import alpaca_helpers as helpers
 
 # Try to import ZWO EAF SDK
 ZWO_EAF_AVAILABLE = False
@@ -103,6 +104,10 @@ class FocuserBase:
         self.moving = False
         self.current_position = 0
         self.target_position = 0
+        self._move_lock = Lock()       # Held for a whole move, backlash steps included
+        self._move_state_lock = Lock() # Guards the two counters below
+        self._move_generation = 0      # Bumped by every new move and by halt()
+        self._moves_pending = 0        # start_move() threads not yet finished
         
         # Focuser configuration
         self.max_position = 100000  # Maximum steps
@@ -149,7 +154,41 @@ class FocuserBase:
         1. Determine direction of move
         2. If direction changed, overshoot by backlash amount
         3. Always approach final position from same direction
+        
+        Moves run one at a time, so two backlash sequences never interleave.
+        Only the latest move runs: an older one still waiting for the lock,
+        or between its backlash steps, gives up once a newer move or a
+        halt() has been requested.
         """
+        return self._run_move(position, self._next_move_generation())
+    
+    def _next_move_generation(self):
+        """Start a new move generation, making every earlier move stale"""
+        with self._move_state_lock:
+            self._move_generation += 1
+            return self._move_generation
+    
+    def _cancel_moves(self):
+        """Make every requested move stale - called by halt()"""
+        self._next_move_generation()
+    
+    def _run_move(self, position, generation):
+        """Run one move unless a newer move or a halt has superseded it"""
+        with self._move_lock:
+            if generation != self._move_generation:
+                return False
+            return self._move_with_backlash(position, generation)
+    
+    def _run_background_move(self, position, generation):
+        """Thread body for start_move()"""
+        try:
+            self._run_move(position, generation)
+        finally:
+            with self._move_state_lock:
+                self._moves_pending -= 1
+    
+    def _move_with_backlash(self, position, generation):
+        """Body of move_to(), called with the move lock held"""
         if not self.is_connected:
             return False
         
@@ -181,6 +220,8 @@ class FocuserBase:
                     overshoot_pos = max(0, position - self.backlash_steps)
                     print(f"  Step 1: Overshoot to {overshoot_pos}")
                     self._move_without_backlash(overshoot_pos)
+                    if generation != self._move_generation:
+                        return False
                     print(f"  Step 2: Approach target {position}")
                     result = self._move_without_backlash(position)
                 else:
@@ -188,6 +229,8 @@ class FocuserBase:
                     overshoot_pos = min(self.max_position, position + self.backlash_steps)
                     print(f"  Step 1: Overshoot to {overshoot_pos}")
                     self._move_without_backlash(overshoot_pos)
+                    if generation != self._move_generation:
+                        return False
                     print(f"  Step 2: Approach target {position}")
                     result = self._move_without_backlash(position)
             else:
@@ -203,6 +246,33 @@ class FocuserBase:
         
         return result
     
+    def start_move(self, position):
+        """
+        Run move_to() in a background thread and return immediately
+        
+        ASCOM Move is asynchronous - clients poll IsMoving until it clears,
+        which is answered from local state while the move thread runs.
+        """
+        if not self.is_connected:
+            return False
+        
+        # A Move during a move replaces it - stop the running one (which
+        # makes it stale); the new thread waits on the move lock until it
+        # has returned, and any older thread still waiting gives up
+        with self._move_state_lock:
+            busy = self._moves_pending > 0
+        if busy:
+            self.halt()
+        
+        with self._move_state_lock:
+            self._move_generation += 1
+            generation = self._move_generation
+            self._moves_pending += 1
+        
+        thread = Thread(target=self._run_background_move, args=(position, generation), daemon=True)
+        thread.start()
+        return True
+    
     def _move_without_backlash(self, position):
         """
         Internal method: move to position without backlash logic
@@ -217,12 +287,17 @@ class FocuserBase:
         return self.move_to(target)
     
     def halt(self):
-        """Stop movement"""
+        """
+        Stop movement
+        
+        Implementations call _cancel_moves() first, so a backlash move stops
+        after its current step and queued moves never start.
+        """
         raise NotImplementedError
     
     def is_moving(self):
-        """Check if focuser is moving"""
-        return self.moving
+        """Check if focuser is moving, or has a started move still to run"""
+        return self.moving or self._moves_pending > 0
     
     def get_temperature(self):
         """Get temperature reading"""
@@ -306,6 +381,7 @@ class ZWOFocuser(FocuserBase):
         self.is_connected = False
         self.eaf_id = -1
     
+    @helpers.single_flight()
     def get_position(self):
         """Get current position"""
         if not self.is_connected:
@@ -327,39 +403,43 @@ class ZWOFocuser(FocuserBase):
         if not self.is_connected:
             return False
         
+        self.moving = True
+        self.target_position = position
+        
         with self.lock:
-            self.moving = True
-            self.target_position = position
-            
             result = eaf_lib.EAFMove(self.eaf_id, position)
-            if result == EAF_ERROR_CODE.EAF_SUCCESS:
-                # Wait for movement to complete
-                while True:
-                    time.sleep(0.05)
-                    
-                    # Check if still moving
-                    is_moving = ctypes.c_bool()
+        
+        if result == EAF_ERROR_CODE.EAF_SUCCESS:
+            # Wait for movement to complete - the lock is only held per SDK
+            # call so position/temperature reads can interleave
+            while True:
+                time.sleep(0.05)
+                
+                # Check if still moving
+                is_moving = ctypes.c_bool()
+                with self.lock:
                     result = eaf_lib.EAFIsMoving(self.eaf_id, ctypes.byref(is_moving))
-                    
-                    if result == EAF_ERROR_CODE.EAF_SUCCESS:
-                        if not is_moving.value:
-                            break
-                    else:
-                        print(f"✗ Error checking movement: {result}")
-                        self.moving = False
-                        return False
                 
-                # Get final position
-                self.current_position = self.get_position()
-                self.moving = False
-                return True
-            else:
-                print(f"✗ Failed to move: {result}")
-                self.moving = False
-                return False
+                if result == EAF_ERROR_CODE.EAF_SUCCESS:
+                    if not is_moving.value:
+                        break
+                else:
+                    print(f"✗ Error checking movement: {result}")
+                    self.moving = False
+                    return False
+            
+            # Get final position
+            self.current_position = self.get_position()
+            self.moving = False
+            return True
+        else:
+            print(f"✗ Failed to move: {result}")
+            self.moving = False
+            return False
     
     def halt(self):
         """Stop movement immediately"""
+        self._cancel_moves()
         if not self.is_connected:
             return False
         
@@ -367,17 +447,7 @@ class ZWOFocuser(FocuserBase):
         self.moving = False
         return result == EAF_ERROR_CODE.EAF_SUCCESS
     
-    def is_moving(self):
-        """Check if focuser is currently moving"""
-        if not self.is_connected:
-            return False
-        
-        is_moving = ctypes.c_bool()
-        result = eaf_lib.EAFIsMoving(self.eaf_id, ctypes.byref(is_moving))
-        if result == EAF_ERROR_CODE.EAF_SUCCESS:
-            return is_moving.value
-        return False
-    
+    @helpers.single_flight()
     def get_temperature(self):
         """Get temperature reading from focuser"""
         self._update_temperature()
@@ -470,6 +540,7 @@ class MockFocuser(FocuserBase):
     
     def halt(self):
         """Stop movement"""
+        self._cancel_moves()
         if self.moving:
             print("○ Mock: Movement halted")
             self.moving = False
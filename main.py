@@ -4,11 +4,28 @@ OnStepX Alpaca Bridge - Main Server
 Complete implementation with Telescope + 2 Cameras + FilterWheel + Focuser
 """
 
-from flask import Flask, request
+from flask import Blueprint, Flask
 import sys
-import base64
+import logging
+import operator
+import queue
 import numpy as np
 import signal
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from logging.handlers import QueueHandler, QueueListener
+
+# Production WSGI server (optional, falls back to the Werkzeug dev server)
+try:
+    from waitress import serve
+    WAITRESS_AVAILABLE = True
+except ImportError:
+    WAITRESS_AVAILABLE = False
+
+# SIMD Base64 for imagearrayvariant (optional, same API as the stdlib module)
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
 
 # Import configuration and helpers
 import config
@@ -24,8 +41,21 @@ from focuser import create_focuser
 # Import discovery service
 from alpaca_discovery import AlpacaDiscovery
 
-# Initialize Flask app
-app = Flask(__name__)
+logger = logging.getLogger(__name__)
+
+# Initialize Flask app (API only - no /static route in the URL map)
+app = Flask(__name__, static_folder=None)
+app.url_map.strict_slashes = False
+
+# Alpaca PUT bodies are a few short fields - refuse anything bigger before
+# it is read (helpers.get_request_params() also caps the field count)
+app.config['MAX_CONTENT_LENGTH'] = config.HTTP_MAX_CONTENT_LENGTH
+
+# Device APIs share one URL prefix per device type
+telescope_bp = Blueprint('telescope', __name__, url_prefix='/api/v1/telescope/0')
+camera_bp = Blueprint('camera', __name__, url_prefix='/api/v1/camera/<int:device_number>')
+filterwheel_bp = Blueprint('filterwheel', __name__, url_prefix='/api/v1/filterwheel/0')
+focuser_bp = Blueprint('focuser', __name__, url_prefix='/api/v1/focuser/0')
 
 # Global device instances
 telescope = None
@@ -35,123 +65,344 @@ filterwheel = None
 focuser = None
 discovery = None
 
+# Lookups built once by init_devices()
+cameras = ()        # Indexed by device_number (None where no camera)
+device_list = []    # Configured devices in Alpaca format
+device_list_value = helpers.prebuilt_value(device_list)
+app.cameras = cameras
+
+# ============================================================================
+# PROPERTY ACCESSORS
+# ============================================================================
+
+# Hot GET routes read device state through these prebuilt C-level callables
+# rather than a fresh attribute/method lookup on every request
+
+# Telescope
+_TEL_RIGHT_ASCENSION = operator.methodcaller('get_right_ascension')
+_TEL_DECLINATION = operator.methodcaller('get_declination')
+_TEL_AZIMUTH = operator.methodcaller('get_azimuth')
+_TEL_ALTITUDE = operator.methodcaller('get_altitude')
+_TEL_TRACKING = operator.methodcaller('get_tracking')
+_TEL_AT_PARK = operator.methodcaller('get_at_park')
+_TEL_IS_CONNECTED = operator.attrgetter('is_connected')
+_TEL_TRACKING_RATE = operator.attrgetter('tracking_rate')
+_TEL_SITE_LATITUDE = operator.attrgetter('site_latitude')
+_TEL_SITE_LONGITUDE = operator.attrgetter('site_longitude')
+_TEL_SITE_ELEVATION = operator.attrgetter('site_elevation')
+_TEL_TARGET_RA = operator.attrgetter('target_ra')
+_TEL_TARGET_DEC = operator.attrgetter('target_dec')
+
+# Camera
+_CAM_IS_CONNECTED = operator.attrgetter('is_connected')
+_CAM_CAMERA_STATE = operator.attrgetter('camera_state')
+_CAM_CAMERA_XSIZE = operator.attrgetter('camera_xsize')
+_CAM_CAMERA_YSIZE = operator.attrgetter('camera_ysize')
+_CAM_PIXEL_SIZE_X = operator.attrgetter('pixel_size_x')
+_CAM_PIXEL_SIZE_Y = operator.attrgetter('pixel_size_y')
+_CAM_SENSOR_TYPE = operator.attrgetter('sensor_type')
+_CAM_MAX_BIN_X = operator.attrgetter('max_bin_x')
+_CAM_MAX_BIN_Y = operator.attrgetter('max_bin_y')
+_CAM_NUM_X = operator.attrgetter('num_x')
+_CAM_NUM_Y = operator.attrgetter('num_y')
+_CAM_IMAGE_READY = operator.attrgetter('image_ready')
+_CAM_PERCENT_COMPLETED = operator.attrgetter('percent_completed')
+_CAM_GAIN_MIN = operator.attrgetter('gain_min')
+_CAM_GAIN_MAX = operator.attrgetter('gain_max')
+_CAM_OFFSET_MIN = operator.attrgetter('offset_min')
+_CAM_OFFSET_MAX = operator.attrgetter('offset_max')
+_CAM_COOLER_ON = operator.attrgetter('cooler_on')
+
+# Kept current by each camera's background temperature poll
+_CAM_CCD_TEMPERATURE = operator.attrgetter('ccd_temperature')
+_CAM_COOLER_POWER = operator.attrgetter('cooler_power')
+_CAM_SET_CCD_TEMPERATURE = operator.attrgetter('set_ccd_temperature')
+
+# ============================================================================
+# ERROR CODES
+# ============================================================================
+
+# Resolved once so error paths skip the config dict lookups
+_ERR_NOT_IMPLEMENTED = config.ASCOM_ERROR_CODES['NOT_IMPLEMENTED']
+_ERR_INVALID_VALUE = config.ASCOM_ERROR_CODES['INVALID_VALUE']
+_ERR_UNSPECIFIED = config.ASCOM_ERROR_CODES['UNSPECIFIED_ERROR']
+
+# ============================================================================
+# COORDINATE LIMITS
+# ============================================================================
+
+# (min, max, max_inclusive) accepted by the slew, sync and target
+# endpoints - RA and azimuth wrap, so their maximum itself is excluded
+_RA_RANGE = (0.0, 24.0, False)
+_DEC_RANGE = (-90.0, 90.0, True)
+_AZ_RANGE = (0.0, 360.0, False)
+_ALT_RANGE = (-90.0, 90.0, True)
+
+def _validate_coordinate(value, limits, name):
+    """Validate a coordinate against one of the ranges above"""
+    min_val, max_val, max_inclusive = limits
+    return helpers.validate_range(value, min_val, max_val, name, max_inclusive)
+
+# ============================================================================
+# PREBUILT VALUES
+# ============================================================================
+
+# Constant Values are JSON-encoded once at import and sent verbatim
+_TELESCOPE_NAME = helpers.prebuilt_value(config.DEVICES['telescope']['name'])
+_TELESCOPE_DESCRIPTION = helpers.prebuilt_value("OnStepX telescope mount via Alpaca")
+_TELESCOPE_DRIVERINFO = helpers.prebuilt_value("OnStepX Alpaca Bridge v1.0")
+_TELESCOPE_DRIVERVERSION = helpers.prebuilt_value("1.0")
+_TELESCOPE_SUPPORTEDACTIONS = helpers.prebuilt_value([])
+_INTERFACE_VERSION = helpers.prebuilt_value(4)
+_FILTERWHEEL_DESCRIPTION = helpers.prebuilt_value("ZWO Electronic Filter Wheel")
+_FOCUSER_DESCRIPTION = helpers.prebuilt_value("ZWO Electronic Auto Focuser")
+_TRUE = helpers.prebuilt_value(True)
+_API_VERSIONS = helpers.prebuilt_value([1])
+_SERVER_DESCRIPTION = helpers.prebuilt_value(config.SERVER_INFO)
+_TRACKING_RATES = helpers.prebuilt_value([0, 1, 2, 3])  # Sidereal, Lunar, Solar, King
+_FILTERWHEEL_NAME = helpers.prebuilt_value(config.DEVICES['filterwheel']['name'])
+_FOCUSER_NAME = helpers.prebuilt_value(config.DEVICES['focuser']['name'])
+
+# ============================================================================
+# DEVICE CHECKS
+# ============================================================================
+
+# Existence checks for endpoints that also work while disconnected
+require_telescope = helpers.require_device('telescope', "Telescope not available")
+require_filterwheel = helpers.require_device('filterwheel', "FilterWheel not available")
+require_focuser = helpers.require_device('focuser', "Focuser not available")
+
+# ============================================================================
+# FORM FIELD READERS
+# ============================================================================
+
+# One prebuilt reader per PUT parameter
+_FORM_CONNECTED = helpers.make_form_getter('Connected', False, bool)
+_FORM_RIGHT_ASCENSION = helpers.make_form_getter('RightAscension', 0.0, float)
+_FORM_DECLINATION = helpers.make_form_getter('Declination', 0.0, float)
+_FORM_AZIMUTH = helpers.make_form_getter('Azimuth', 0.0, float)
+_FORM_ALTITUDE = helpers.make_form_getter('Altitude', 0.0, float)
+_FORM_TRACKING = helpers.make_form_getter('Tracking', True, bool)
+_FORM_TRACKING_RATE = helpers.make_form_getter('TrackingRate', 0, int)
+_FORM_TARGET_RIGHT_ASCENSION = helpers.make_form_getter('TargetRightAscension', 0.0, float)
+_FORM_TARGET_DECLINATION = helpers.make_form_getter('TargetDeclination', 0.0, float)
+_FORM_SITE_LATITUDE = helpers.make_form_getter('SiteLatitude', 0.0, float)
+_FORM_SITE_LONGITUDE = helpers.make_form_getter('SiteLongitude', 0.0, float)
+_FORM_SITE_ELEVATION = helpers.make_form_getter('SiteElevation', 0.0, float)
+_FORM_AXIS = helpers.make_form_getter('Axis', 0, int)
+_FORM_RATE = helpers.make_form_getter('Rate', 0.0, float)
+_FORM_DURATION = helpers.make_form_getter('Duration', 1.0, float)
+_FORM_LIGHT = helpers.make_form_getter('Light', True, bool)
+_FORM_NUM_X = helpers.make_form_getter('NumX', None, int)     # None -> full width
+_FORM_NUM_Y = helpers.make_form_getter('NumY', None, int)     # None -> full height
+_FORM_COOLER_ON = helpers.make_form_getter('CoolerOn', False, bool)
+_FORM_SET_CCD_TEMPERATURE = helpers.make_form_getter('SetCCDTemperature', 0.0, float)
+_FORM_POSITION = helpers.make_form_getter('Position', 0, int)
+_FORM_TEMP_COMP = helpers.make_form_getter('TempComp', False, bool)
+
+def setup_logging():
+    """
+    Configure logging from LOGGING_CONFIG
+    
+    Records are handed to a queue and written by a background listener, so
+    callers never block on a slow console or journal.
+    
+    Returns:
+        QueueListener: The started listener (stop it on shutdown to flush)
+    """
+    formatter = logging.Formatter(config.LOGGING_CONFIG['format'])
+    handlers = [logging.StreamHandler()]
+    if config.LOGGING_CONFIG.get('log_to_file'):
+        try:
+            handlers.append(logging.FileHandler(config.LOGGING_CONFIG['log_file']))
+        except OSError as e:
+            print(f"⚠ Cannot open log file: {e}")
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.setLevel(config.LOGGING_CONFIG['level'])
+    # Replace any default handler an import may have installed
+    root.handlers = [QueueHandler(log_queue)]
+    
+    listener = QueueListener(log_queue, *handlers)
+    listener.start()
+    return listener
+
+def init_telescope():
+    """Create the OnStepX mount, or return None if it fails"""
+    try:
+        # Get connection parameters based on type
+        conn_type = config.TELESCOPE_CONFIG['connection_type']
+        
+        if conn_type == 'network':
+            mount = OnStepXMount(
+                connection_type='network',
+                host=config.TELESCOPE_CONFIG['network']['host'],
+                port=config.TELESCOPE_CONFIG['network']['port'],
+                socket_options=config.TELESCOPE_CONFIG['network'].get('socket_options')
+            )
+            logger.info(f"[Telescope] Configured for NETWORK: {config.TELESCOPE_CONFIG['network']['host']}:{config.TELESCOPE_CONFIG['network']['port']}")
+        else:  # serial
+            mount = OnStepXMount(
+                connection_type='serial',
+                port=config.TELESCOPE_CONFIG['serial']['port'],
+                baudrate=config.TELESCOPE_CONFIG['serial']['baudrate']
+            )
+            logger.info(f"[Telescope] Configured for SERIAL: {config.TELESCOPE_CONFIG['serial']['port']}")
+        
+        logger.info("✓ Telescope initialized")
+        return mount
+    except Exception as e:
+        logger.error(f"✗ Telescope initialization failed: {e}")
+        return None
+
+def init_camera_zwo():
+    """Create the ZWO camera, or return None if it fails"""
+    try:
+        camera = ZWOCamera(
+            camera_id=config.DEVICES['camera_zwo']['camera_id'],
+            sdk_path=config.CAMERA_CONFIG['zwo_sdk_path']
+        )
+        logger.info("✓ ZWO camera initialized")
+        return camera
+    except Exception as e:
+        logger.error(f"✗ ZWO camera initialization failed: {e}")
+        return None
+
+def init_camera_touptek():
+    """Create the ToupTek camera, or return None if it fails"""
+    try:
+        camera = ToupTekCamera(
+            camera_id=config.DEVICES['camera_touptek']['camera_id']
+        )
+        logger.info("✓ ToupTek camera initialized")
+        return camera
+    except Exception as e:
+        logger.error(f"✗ ToupTek camera initialization failed: {e}")
+        return None
+
+def init_filterwheel():
+    """Create the filter wheel, or return None if it fails"""
+    try:
+        mode = config.FILTERWHEEL_CONFIG['mode']
+        logger.info(f"[FilterWheel] Mode: {mode}")
+        
+        # Get parameters based on mode
+        wheel_id = config.FILTERWHEEL_CONFIG.get('zwo', {}).get('wheel_id', 0)
+        slot_count = config.FILTERWHEEL_CONFIG.get('mock', {}).get('slot_count', 8)
+        
+        # Create filterwheel with correct parameters
+        wheel = create_filterwheel(
+            mode=mode,
+            wheel_id=wheel_id,
+            slot_count=slot_count
+        )
+        
+        # Apply custom filter names and offsets if configured
+        if config.FILTERWHEEL_CONFIG.get('filter_names'):
+            wheel.filter_names = config.FILTERWHEEL_CONFIG['filter_names']
+        if config.FILTERWHEEL_CONFIG.get('focus_offsets'):
+            wheel.focus_offsets = config.FILTERWHEEL_CONFIG['focus_offsets']
+        wheel.invalidate_cache()
+        
+        logger.info("✓ Filter wheel initialized")
+        if hasattr(wheel, 'slot_count'):
+            logger.info(f"  Slots: {wheel.slot_count}")
+            if hasattr(wheel, 'filter_names'):
+                logger.info(f"  Filters: {', '.join(wheel.filter_names[:wheel.slot_count])}")
+        return wheel
+    except Exception as e:
+        logger.error(f"✗ FilterWheel: {e}")
+        return None
+
+def init_focuser():
+    """Create the focuser, or return None if it fails"""
+    try:
+        mode = config.FOCUSER_CONFIG['mode']
+        logger.info(f"[Focuser] Mode: {mode}")
+        
+        # Get parameters based on mode
+        focuser_id = config.FOCUSER_CONFIG.get('zwo', {}).get('focuser_id', 0)
+        max_position = config.FOCUSER_CONFIG.get('mock', {}).get('max_position', 100000)
+        
+        # Create focuser with correct parameters
+        device = create_focuser(
+            mode=mode,
+            focuser_id=focuser_id,
+            max_position=max_position
+        )
+        logger.info("✓ Focuser initialized")
+        if hasattr(device, 'max_position'):
+            logger.info(f"  Max position: {device.max_position} steps")
+            if hasattr(device, 'step_size'):
+                logger.info(f"  Step size: {device.step_size} microns")
+        return device
+    except Exception as e:
+        logger.error(f"✗ Focuser: {e}")
+        return None
+
 def init_devices():
     """Initialize all configured devices"""
     global telescope, camera_zwo, camera_touptek, filterwheel, focuser
+    global cameras, device_list, device_list_value
     
-    print("Initializing devices...")
+    logger.info("Initializing devices...")
     
-    # Initialize telescope
+    # Device name -> init function for everything enabled in config
+    initializers = {}
     if config.DEVICES['telescope']['enabled']:
-        try:
-            # Get connection parameters based on type
-            conn_type = config.TELESCOPE_CONFIG['connection_type']
-            
-            if conn_type == 'network':
-                telescope = OnStepXMount(
-                    connection_type='network',
-                    host=config.TELESCOPE_CONFIG['network']['host'],
-                    port=config.TELESCOPE_CONFIG['network']['port']
-                )
-                print(f"[Telescope] Configured for NETWORK: {config.TELESCOPE_CONFIG['network']['host']}:{config.TELESCOPE_CONFIG['network']['port']}")
-            else:  # serial
-                telescope = OnStepXMount(
-                    connection_type='serial',
-                    port=config.TELESCOPE_CONFIG['serial']['port'],
-                    baudrate=config.TELESCOPE_CONFIG['serial']['baudrate']
-                )
-                print(f"[Telescope] Configured for SERIAL: {config.TELESCOPE_CONFIG['serial']['port']}")
-            
-            app.telescope = telescope
-            print("✓ Telescope initialized")
-        except Exception as e:
-            print(f"✗ Telescope initialization failed: {e}")
-    
-    # Initialize ZWO camera
+        initializers['telescope'] = init_telescope
     if config.DEVICES['camera_zwo']['enabled'] and ZWO_AVAILABLE:
-        try:
-            camera_zwo = ZWOCamera(
-                camera_id=config.DEVICES['camera_zwo']['camera_id'],
-                sdk_path=config.CAMERA_CONFIG['zwo_sdk_path']
-            )
-            app.camera_zwo = camera_zwo
-            print("✓ ZWO camera initialized")
-        except Exception as e:
-            print(f"✗ ZWO camera initialization failed: {e}")
-    
-    # Initialize ToupTek camera
+        initializers['camera_zwo'] = init_camera_zwo
     if config.DEVICES['camera_touptek']['enabled'] and TOUPTEK_AVAILABLE:
-        try:
-            camera_touptek = ToupTekCamera(
-                camera_id=config.DEVICES['camera_touptek']['camera_id']
-            )
-            app.camera_touptek = camera_touptek
-            print("✓ ToupTek camera initialized")
-        except Exception as e:
-            print(f"✗ ToupTek camera initialization failed: {e}")
-    
-    # Initialize filter wheel
+        initializers['camera_touptek'] = init_camera_touptek
     if config.DEVICES['filterwheel']['enabled']:
-        try:
-            mode = config.FILTERWHEEL_CONFIG['mode']
-            print(f"[FilterWheel] Mode: {mode}")
-            
-            # Get parameters based on mode
-            wheel_id = config.FILTERWHEEL_CONFIG.get('zwo', {}).get('wheel_id', 0)
-            slot_count = config.FILTERWHEEL_CONFIG.get('mock', {}).get('slot_count', 8)
-            
-            # Create filterwheel with correct parameters
-            filterwheel = create_filterwheel(
-                mode=mode,
-                wheel_id=wheel_id,
-                slot_count=slot_count
-            )
-            
-            # Apply custom filter names and offsets if configured
-            if config.FILTERWHEEL_CONFIG.get('filter_names'):
-                filterwheel.filter_names = config.FILTERWHEEL_CONFIG['filter_names']
-            if config.FILTERWHEEL_CONFIG.get('focus_offsets'):
-                filterwheel.focus_offsets = config.FILTERWHEEL_CONFIG['focus_offsets']
-            
-            app.filterwheel = filterwheel
-            print("✓ Filter wheel initialized")
-            if hasattr(filterwheel, 'slot_count'):
-                print(f"  Slots: {filterwheel.slot_count}")
-                if hasattr(filterwheel, 'filter_names'):
-                    print(f"  Filters: {', '.join(filterwheel.filter_names[:filterwheel.slot_count])}")
-        except Exception as e:
-            print(f"✗ FilterWheel: {e}")
-    
-    # Initialize focuser
+        initializers['filterwheel'] = init_filterwheel
     if config.DEVICES['focuser']['enabled']:
-        try:
-            mode = config.FOCUSER_CONFIG['mode']
-            print(f"[Focuser] Mode: {mode}")
-            
-            # Get parameters based on mode
-            focuser_id = config.FOCUSER_CONFIG.get('zwo', {}).get('focuser_id', 0)
-            max_position = config.FOCUSER_CONFIG.get('mock', {}).get('max_position', 100000)
-            
-            # Create focuser with correct parameters
-            focuser = create_focuser(
-                mode=mode,
-                focuser_id=focuser_id,
-                max_position=max_position
-            )
-            app.focuser = focuser
-            print("✓ Focuser initialized")
-            if hasattr(focuser, 'max_position'):
-                print(f"  Max position: {focuser.max_position} steps")
-                if hasattr(focuser, 'step_size'):
-                    print(f"  Step size: {focuser.step_size} microns")
-        except Exception as e:
-            print(f"✗ Focuser: {e}")
+        initializers['focuser'] = init_focuser
+    
+    # USB enumeration and handshakes are independent - run them side by side
+    devices = {}
+    if initializers:
+        with ThreadPoolExecutor(max_workers=len(initializers)) as executor:
+            futures = {executor.submit(init): name for name, init in initializers.items()}
+            for future in as_completed(futures):
+                devices[futures[future]] = future.result()
+    
+    # Publish the devices only once every init has finished
+    telescope = devices.get('telescope')
+    camera_zwo = devices.get('camera_zwo')
+    camera_touptek = devices.get('camera_touptek')
+    filterwheel = devices.get('filterwheel')
+    focuser = devices.get('focuser')
+    
+    for name, device in devices.items():
+        if device is not None:
+            setattr(app, name, device)
+    
+    # Build device lookups once - devices do not change after startup
+    cameras = _build_camera_table()
+    app.cameras = cameras
+    
+    device_list = _build_device_list()
+    device_list_value = helpers.prebuilt_value(device_list)
+
+def _build_camera_table():
+    """Build the device_number-indexed camera tuple"""
+    by_number = {}
+    if camera_zwo:
+        by_number[config.DEVICES['camera_zwo']['device_number']] = camera_zwo
+    if camera_touptek:
+        by_number[config.DEVICES['camera_touptek']['device_number']] = camera_touptek
+    
+    if not by_number:
+        return ()
+    return tuple(by_number.get(n) for n in range(max(by_number) + 1))
 
-def get_current_devices():
-    """
-    Get list of currently enabled devices for discovery response
-    Used by discovery service to report available devices
-    """
+def _build_device_list():
+    """Build the list of enabled devices in Alpaca format"""
     devices = []
     
     if telescope and config.DEVICES['telescope']['enabled']:
@@ -196,14 +447,19 @@ def get_current_devices():
     
     return devices
 
+def get_current_devices():
+    """
+    Get list of currently enabled devices for discovery response
+    Used by discovery service to report available devices
+    """
+    return device_list
 
 def get_camera(device_number):
     """Get camera by device number"""
-    if device_number == 0 and camera_zwo:
-        return camera_zwo
-    elif device_number == 1 and camera_touptek:
-        return camera_touptek
-    return None
+    try:
+        return cameras[device_number]
+    except IndexError:
+        return None
 
 # ============================================================================
 # MANAGEMENT API
@@ -212,187 +468,168 @@ def get_camera(device_number):
 @app.route('/management/apiversions')
 def api_versions():
     """Get supported API versions"""
-    return helpers.alpaca_response([1])
+    return helpers.alpaca_response(_API_VERSIONS, etag=True)
 
 @app.route('/management/v1/description')
 def server_description():
     """Get server description"""
-    return helpers.alpaca_response(config.SERVER_INFO)
+    return helpers.alpaca_response(_SERVER_DESCRIPTION, etag=True)
 
 @app.route('/management/v1/configureddevices')
 def configured_devices():
     """Get list of configured devices"""
-    devices = []
-    
-    if telescope and config.DEVICES['telescope']['enabled']:
-        devices.append({
-            "DeviceName": config.DEVICES['telescope']['name'],
-            "DeviceType": "Telescope",
-            "DeviceNumber": config.DEVICES['telescope']['device_number'],
-            "UniqueID": config.DEVICES['telescope']['unique_id']
-        })
-    
-    if camera_zwo and config.DEVICES['camera_zwo']['enabled']:
-        devices.append({
-            "DeviceName": config.DEVICES['camera_zwo']['name'],
-            "DeviceType": "Camera",
-            "DeviceNumber": config.DEVICES['camera_zwo']['device_number'],
-            "UniqueID": config.DEVICES['camera_zwo']['unique_id']
-        })
-    
-    if camera_touptek and config.DEVICES['camera_touptek']['enabled']:
-        devices.append({
-            "DeviceName": config.DEVICES['camera_touptek']['name'],
-            "DeviceType": "Camera",
-            "DeviceNumber": config.DEVICES['camera_touptek']['device_number'],
-            "UniqueID": config.DEVICES['camera_touptek']['unique_id']
-        })
-    
-    if filterwheel and config.DEVICES['filterwheel']['enabled']:
-        devices.append({
-            "DeviceName": config.DEVICES['filterwheel']['name'],
-            "DeviceType": "FilterWheel",
-            "DeviceNumber": config.DEVICES['filterwheel']['device_number'],
-            "UniqueID": config.DEVICES['filterwheel']['unique_id']
-        })
-    
-    if focuser and config.DEVICES['focuser']['enabled']:
-        devices.append({
-            "DeviceName": config.DEVICES['focuser']['name'],
-            "DeviceType": "Focuser",
-            "DeviceNumber": config.DEVICES['focuser']['device_number'],
-            "UniqueID": config.DEVICES['focuser']['unique_id']
-        })
-    
-    return helpers.alpaca_response(devices)
+    return helpers.alpaca_response(device_list_value, etag=True)
 
 # ============================================================================
 # COMMON DEVICE API (ALL DEVICES)
 # ============================================================================
 
 # Telescope common endpoints
-@app.route('/api/v1/telescope/0/connected', methods=['GET', 'PUT'])
+@telescope_bp.get('/connected')
+@require_telescope
 def telescope_connected():
-    """Get/set telescope connection"""
-    if not telescope:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_IMPLEMENTED'], "Telescope not available")
-    
-    if request.method == 'GET':
-        return helpers.alpaca_response(telescope.is_connected)
+    """Get telescope connection"""
+    return helpers.alpaca_response(_TEL_IS_CONNECTED(telescope))
+
+@telescope_bp.put('/connected')
+@require_telescope
+def telescope_connected_put():
+    """Set telescope connection"""
+    connected = _FORM_CONNECTED()
+    if connected:
+        telescope.connect()
     else:
-        connected = helpers.get_form_value('Connected', False, bool)
-        if connected:
-            telescope.connect()
-        else:
-            telescope.disconnect()
-        return helpers.alpaca_response(None)
+        telescope.disconnect()
+    return helpers.alpaca_response(None)
 
-@app.route('/api/v1/telescope/0/name')
+@telescope_bp.route('/name')
+@require_telescope
 def telescope_name():
     """Get telescope name"""
-    if not telescope:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_IMPLEMENTED'], "Telescope not available")
-    return helpers.alpaca_response(config.DEVICES['telescope']['name'])
+    return helpers.alpaca_response(_TELESCOPE_NAME, etag=True)
 
-@app.route('/api/v1/telescope/0/description')
+@telescope_bp.route('/description')
+@require_telescope
 def telescope_description():
     """Get telescope description"""
-    if not telescope:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_IMPLEMENTED'], "Telescope not available")
-    return helpers.alpaca_response("OnStepX telescope mount via Alpaca")
+    return helpers.alpaca_response(_TELESCOPE_DESCRIPTION, etag=True)
 
-@app.route('/api/v1/telescope/0/driverinfo')
+@telescope_bp.route('/driverinfo')
+@require_telescope
 def telescope_driverinfo():
     """Get telescope driver info"""
-    if not telescope:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_IMPLEMENTED'], "Telescope not available")
-    return helpers.alpaca_response("OnStepX Alpaca Bridge v1.0")
+    return helpers.alpaca_response(_TELESCOPE_DRIVERINFO, etag=True)
 
-@app.route('/api/v1/telescope/0/driverversion')
+@telescope_bp.route('/driverversion')
+@require_telescope
 def telescope_driverversion():
     """Get telescope driver version"""
-    if not telescope:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_IMPLEMENTED'], "Telescope not available")
-    return helpers.alpaca_response("1.0")
+    return helpers.alpaca_response(_TELESCOPE_DRIVERVERSION, etag=True)
 
-@app.route('/api/v1/telescope/0/interfaceversion')
+@telescope_bp.route('/interfaceversion')
+@require_telescope
 def telescope_interfaceversion():
     """Get telescope interface version"""
-    if not telescope:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_IMPLEMENTED'], "Telescope not available")
-    return helpers.alpaca_response(4)
+    return helpers.alpaca_response(_INTERFACE_VERSION, etag=True)
 
-@app.route('/api/v1/telescope/0/supportedactions')
+@telescope_bp.route('/supportedactions')
+@require_telescope
 def telescope_supportedactions():
     """Get list of supported actions"""
-    if not telescope:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_IMPLEMENTED'], "Telescope not available")
-    return helpers.alpaca_response([])
+    return helpers.alpaca_response(_TELESCOPE_SUPPORTEDACTIONS, etag=True)
 
 # ============================================================================
 # TELESCOPE API - COORDINATES
 # ============================================================================
 
-@app.route('/api/v1/telescope/0/rightascension')
+@telescope_bp.route('/rightascension')
 @helpers.require_connected('telescope')
 def telescope_rightascension():
     """Get current RA"""
-    return helpers.alpaca_response(telescope.right_ascension)
+    return helpers.alpaca_response(_TEL_RIGHT_ASCENSION(telescope))
 
-@app.route('/api/v1/telescope/0/declination')
+@telescope_bp.route('/declination')
 @helpers.require_connected('telescope')
 def telescope_declination():
     """Get current Dec"""
-    return helpers.alpaca_response(telescope.declination)
+    return helpers.alpaca_response(_TEL_DECLINATION(telescope))
 
-@app.route('/api/v1/telescope/0/azimuth')
+@telescope_bp.route('/azimuth')
 @helpers.require_connected('telescope')
 def telescope_azimuth():
     """Get current azimuth"""
-    return helpers.alpaca_response(telescope.azimuth)
+    return helpers.alpaca_response(_TEL_AZIMUTH(telescope))
 
-@app.route('/api/v1/telescope/0/altitude')
+@telescope_bp.route('/altitude')
 @helpers.require_connected('telescope')
 def telescope_altitude():
     """Get current altitude"""
-    return helpers.alpaca_response(telescope.altitude)
+    return helpers.alpaca_response(_TEL_ALTITUDE(telescope))
+
+@telescope_bp.route('/devicestate')
+@helpers.require_connected('telescope')
+def telescope_devicestate():
+    """Get the commonly polled mount properties in one response"""
+    state = telescope.get_state()
+    state['IsPulseGuiding'] = telescope.is_pulse_guiding()
+    return helpers.alpaca_response(helpers.device_state(state))
 
 # ============================================================================
 # TELESCOPE API - SLEWING
 # ============================================================================
 
-@app.route('/api/v1/telescope/0/slewing')
+@telescope_bp.route('/slewing')
 @helpers.require_connected('telescope')
 def telescope_slewing():
     """Get slewing status"""
     return helpers.alpaca_response(telescope.is_slewing())
 
-@app.route('/api/v1/telescope/0/slewtocoordinates', methods=['PUT'])
-@helpers.require_connected('telescope')
-def telescope_slewtocoordinates():
-    """Slew to coordinates"""
-    ra = helpers.get_form_value('RightAscension', 0.0, float)
-    dec = helpers.get_form_value('Declination', 0.0, float)
-    telescope.slew_to_coords(ra, dec)
-    return helpers.alpaca_response(None)
+# PUT commands taking a coordinate pair, slews and syncs alike:
+# URL segment -> (mount method, (reader, range, name) per argument)
+COORDINATE_COMMANDS = {
+    'slewtocoordinates': ('slew_to_coords', (
+        (_FORM_RIGHT_ASCENSION, _RA_RANGE, 'RightAscension'),
+        (_FORM_DECLINATION, _DEC_RANGE, 'Declination'))),
+    'slewtoaltaz': ('slew_to_altaz', (
+        (_FORM_AZIMUTH, _AZ_RANGE, 'Azimuth'),
+        (_FORM_ALTITUDE, _ALT_RANGE, 'Altitude'))),
+    'synctocoordinates': ('sync_to_coords', (
+        (_FORM_RIGHT_ASCENSION, _RA_RANGE, 'RightAscension'),
+        (_FORM_DECLINATION, _DEC_RANGE, 'Declination'))),
+    'synctoaltaz': ('sync_to_altaz', (
+        (_FORM_AZIMUTH, _AZ_RANGE, 'Azimuth'),
+        (_FORM_ALTITUDE, _ALT_RANGE, 'Altitude'))),
+}
+
+def _make_coordinate_command_view(method, params):
+    """Build the PUT view for one coordinate slew/sync command"""
+    @helpers.require_connected('telescope')
+    def view():
+        args = []
+        for read_form, limits, name in params:
+            value = read_form()
+            valid, error = _validate_coordinate(value, limits, name)
+            if not valid:
+                return helpers.alpaca_error(_ERR_INVALID_VALUE, error)
+            args.append(value)
+        
+        getattr(telescope, method)(*args)
+        return helpers.alpaca_response(None)
+    return view
 
-@app.route('/api/v1/telescope/0/slewtoaltaz', methods=['PUT'])
-@helpers.require_connected('telescope')
-def telescope_slewtoaltaz():
-    """Slew to alt/az"""
-    azimuth = helpers.get_form_value('Azimuth', 0.0, float)
-    altitude = helpers.get_form_value('Altitude', 0.0, float)
-    telescope.slew_to_altaz(azimuth, altitude)
-    return helpers.alpaca_response(None)
+for _path, (_method, _params) in COORDINATE_COMMANDS.items():
+    telescope_bp.add_url_rule(f'/{_path}', endpoint=f'telescope_{_path}',
+                              view_func=_make_coordinate_command_view(_method, _params),
+                              methods=['PUT'])
 
-@app.route('/api/v1/telescope/0/slewtotarget', methods=['PUT'])
+@telescope_bp.route('/slewtotarget', methods=['PUT'])
 @helpers.require_connected('telescope')
 def telescope_slewtotarget():
     """Slew to target"""
-    telescope.slew_to_coords(telescope.target_ra, telescope.target_dec)
+    telescope.slew_to_target()
     return helpers.alpaca_response(None)
 
-@app.route('/api/v1/telescope/0/abortslew', methods=['PUT'])
+@telescope_bp.route('/abortslew', methods=['PUT'])
 @helpers.require_connected('telescope')
 def telescope_abortslew():
     """Abort slew"""
@@ -403,60 +640,65 @@ def telescope_abortslew():
 # TELESCOPE API - TRACKING
 # ============================================================================
 
-@app.route('/api/v1/telescope/0/tracking', methods=['GET', 'PUT'])
+@telescope_bp.get('/tracking')
 @helpers.require_connected('telescope')
 def telescope_tracking():
-    """Get/set tracking"""
-    if request.method == 'GET':
-        return helpers.alpaca_response(telescope.tracking)
-    else:
-        tracking = helpers.get_form_value('Tracking', True, bool)
-        telescope.set_tracking(tracking)
-        return helpers.alpaca_response(None)
+    """Get tracking"""
+    return helpers.alpaca_response(_TEL_TRACKING(telescope))
+
+@telescope_bp.put('/tracking')
+@helpers.require_connected('telescope')
+def telescope_tracking_put():
+    """Set tracking"""
+    tracking = _FORM_TRACKING()
+    telescope.set_tracking(tracking)
+    return helpers.alpaca_response(None)
 
-@app.route('/api/v1/telescope/0/trackingrate', methods=['GET', 'PUT'])
+@telescope_bp.get('/trackingrate')
 @helpers.require_connected('telescope')
 def telescope_trackingrate():
-    """Get/set tracking rate"""
-    if request.method == 'GET':
-        return helpers.alpaca_response(telescope.tracking_rate)
-    else:
-        rate = helpers.get_form_value('TrackingRate', 0, int)
-        telescope.set_tracking_rate(rate)
-        return helpers.alpaca_response(None)
+    """Get tracking rate"""
+    return helpers.alpaca_response(_TEL_TRACKING_RATE(telescope), etag=True)
+
+@telescope_bp.put('/trackingrate')
+@helpers.require_connected('telescope')
+def telescope_trackingrate_put():
+    """Set tracking rate"""
+    rate = _FORM_TRACKING_RATE()
+    telescope.set_tracking_rate(rate)
+    return helpers.alpaca_response(None)
 
-@app.route('/api/v1/telescope/0/trackingrates')
+@telescope_bp.route('/trackingrates')
+@require_telescope
 def telescope_trackingrates():
     """Get available tracking rates"""
-    if not telescope:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_IMPLEMENTED'], "Telescope not available")
-    return helpers.alpaca_response([0, 1, 2, 3])  # Sidereal, Lunar, Solar, King
+    return helpers.alpaca_response(_TRACKING_RATES, etag=True)
 
 # ============================================================================
 # TELESCOPE API - PARK
 # ============================================================================
 
-@app.route('/api/v1/telescope/0/atpark')
+@telescope_bp.route('/atpark')
 @helpers.require_connected('telescope')
 def telescope_atpark():
     """Get park status"""
-    return helpers.alpaca_response(telescope.at_park)
+    return helpers.alpaca_response(_TEL_AT_PARK(telescope))
 
-@app.route('/api/v1/telescope/0/park', methods=['PUT'])
+@telescope_bp.route('/park', methods=['PUT'])
 @helpers.require_connected('telescope')
 def telescope_park():
     """Park telescope"""
     telescope.park()
     return helpers.alpaca_response(None)
 
-@app.route('/api/v1/telescope/0/unpark', methods=['PUT'])
+@telescope_bp.route('/unpark', methods=['PUT'])
 @helpers.require_connected('telescope')
 def telescope_unpark():
     """Unpark telescope"""
     telescope.unpark()
     return helpers.alpaca_response(None)
 
-@app.route('/api/v1/telescope/0/setpark', methods=['PUT'])
+@telescope_bp.route('/setpark', methods=['PUT'])
 @helpers.require_connected('telescope')
 def telescope_setpark():
     """Set park position"""
@@ -467,151 +709,149 @@ def telescope_setpark():
 # TELESCOPE API - TARGET
 # ============================================================================
 
-@app.route('/api/v1/telescope/0/targetrightascension', methods=['GET', 'PUT'])
+@telescope_bp.get('/targetrightascension')
+@require_telescope
 def telescope_targetrightascension():
-    """Get/set target RA"""
-    if not telescope:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_IMPLEMENTED'], "Telescope not available")
+    """Get target RA"""
+    return helpers.alpaca_response(_TEL_TARGET_RA(telescope))
+
+@telescope_bp.put('/targetrightascension')
+@require_telescope
+def telescope_targetrightascension_put():
+    """Set target RA"""
+    ra = _FORM_TARGET_RIGHT_ASCENSION()
+    valid, error = _validate_coordinate(ra, _RA_RANGE, 'TargetRightAscension')
+    if not valid:
+        return helpers.alpaca_error(_ERR_INVALID_VALUE, error)
     
-    if request.method == 'GET':
-        return helpers.alpaca_response(telescope.target_ra)
-    else:
-        telescope.target_ra = helpers.get_form_value('TargetRightAscension', 0.0, float)
-        return helpers.alpaca_response(None)
+    telescope.set_target_ra(ra)
+    return helpers.alpaca_response(None)
 
-@app.route('/api/v1/telescope/0/targetdeclination', methods=['GET', 'PUT'])
+@telescope_bp.get('/targetdeclination')
+@require_telescope
 def telescope_targetdeclination():
-    """Get/set target Dec"""
-    if not telescope:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_IMPLEMENTED'], "Telescope not available")
+    """Get target Dec"""
+    return helpers.alpaca_response(_TEL_TARGET_DEC(telescope))
+
+@telescope_bp.put('/targetdeclination')
+@require_telescope
+def telescope_targetdeclination_put():
+    """Set target Dec"""
+    dec = _FORM_TARGET_DECLINATION()
+    valid, error = _validate_coordinate(dec, _DEC_RANGE, 'TargetDeclination')
+    if not valid:
+        return helpers.alpaca_error(_ERR_INVALID_VALUE, error)
     
-    if request.method == 'GET':
-        return helpers.alpaca_response(telescope.target_dec)
-    else:
-        telescope.target_dec = helpers.get_form_value('TargetDeclination', 0.0, float)
-        return helpers.alpaca_response(None)
+    telescope.set_target_dec(dec)
+    return helpers.alpaca_response(None)
 
 # ============================================================================
 # TELESCOPE API - SYNC
 # ============================================================================
 
-@app.route('/api/v1/telescope/0/synctocoordinates', methods=['PUT'])
-@helpers.require_connected('telescope')
-def telescope_synctocoordinates():
-    """Sync to coordinates"""
-    ra = helpers.get_form_value('RightAscension', 0.0, float)
-    dec = helpers.get_form_value('Declination', 0.0, float)
-    telescope.sync_to_coords(ra, dec)
-    return helpers.alpaca_response(None)
-
-@app.route('/api/v1/telescope/0/synctoaltaz', methods=['PUT'])
-@helpers.require_connected('telescope')
-def telescope_synctoaltaz():
-    """Sync to alt/az"""
-    azimuth = helpers.get_form_value('Azimuth', 0.0, float)
-    altitude = helpers.get_form_value('Altitude', 0.0, float)
-    telescope.sync_to_altaz(azimuth, altitude)
-    return helpers.alpaca_response(None)
-
-@app.route('/api/v1/telescope/0/synctotarget', methods=['PUT'])
+@telescope_bp.route('/synctotarget', methods=['PUT'])
 @helpers.require_connected('telescope')
 def telescope_synctotarget():
     """Sync to target"""
-    telescope.sync_to_coords(telescope.target_ra, telescope.target_dec)
+    telescope.sync_to_target()
     return helpers.alpaca_response(None)
 
 # ============================================================================
 # TELESCOPE API - SITE CONFIGURATION
 # ============================================================================
 
-@app.route('/api/v1/telescope/0/sitelatitude', methods=['GET', 'PUT'])
+@telescope_bp.get('/sitelatitude')
 @helpers.require_connected('telescope')
 def telescope_sitelatitude():
-    """Get/set site latitude"""
-    if request.method == 'GET':
-        return helpers.alpaca_response(telescope.site_latitude)
-    else:
-        lat = helpers.get_form_value('SiteLatitude', 0.0, float)
-        telescope.set_site_latitude(lat)
-        return helpers.alpaca_response(None)
+    """Get site latitude"""
+    return helpers.alpaca_response(_TEL_SITE_LATITUDE(telescope), etag=True)
 
-@app.route('/api/v1/telescope/0/sitelongitude', methods=['GET', 'PUT'])
+@telescope_bp.put('/sitelatitude')
+@helpers.require_connected('telescope')
+def telescope_sitelatitude_put():
+    """Set site latitude"""
+    lat = _FORM_SITE_LATITUDE()
+    telescope.set_site_latitude(lat)
+    return helpers.alpaca_response(None)
+
+@telescope_bp.get('/sitelongitude')
 @helpers.require_connected('telescope')
 def telescope_sitelongitude():
-    """Get/set site longitude"""
-    if request.method == 'GET':
-        return helpers.alpaca_response(telescope.site_longitude)
-    else:
-        lon = helpers.get_form_value('SiteLongitude', 0.0, float)
-        telescope.set_site_longitude(lon)
-        return helpers.alpaca_response(None)
+    """Get site longitude"""
+    return helpers.alpaca_response(_TEL_SITE_LONGITUDE(telescope), etag=True)
 
-@app.route('/api/v1/telescope/0/siteelevation', methods=['GET', 'PUT'])
+@telescope_bp.put('/sitelongitude')
+@helpers.require_connected('telescope')
+def telescope_sitelongitude_put():
+    """Set site longitude"""
+    lon = _FORM_SITE_LONGITUDE()
+    telescope.set_site_longitude(lon)
+    return helpers.alpaca_response(None)
+
+@telescope_bp.get('/siteelevation')
 @helpers.require_connected('telescope')
 def telescope_siteelevation():
-    """Get/set site elevation"""
-    if request.method == 'GET':
-        return helpers.alpaca_response(telescope.site_elevation)
-    else:
-        elev = helpers.get_form_value('SiteElevation', 0.0, float)
-        telescope.set_site_elevation(elev)
-        return helpers.alpaca_response(None)
+    """Get site elevation"""
+    return helpers.alpaca_response(_TEL_SITE_ELEVATION(telescope), etag=True)
+
+@telescope_bp.put('/siteelevation')
+@helpers.require_connected('telescope')
+def telescope_siteelevation_put():
+    """Set site elevation"""
+    elev = _FORM_SITE_ELEVATION()
+    telescope.set_site_elevation(elev)
+    return helpers.alpaca_response(None)
 
-@app.route('/api/v1/telescope/0/canpulseguide')
+@telescope_bp.route('/canpulseguide')
 def telescope_canpulseguide():
     """Pulse guide capability"""
-    return helpers.alpaca_response(True)
+    return helpers.alpaca_response(_TRUE, etag=True)
     
 # ============================================================================
 # TELESCOPE API - CAPABILITIES
 # ============================================================================
 
-@app.route('/api/v1/telescope/0/canpark')
+@telescope_bp.route('/canpark')
+@require_telescope
 def telescope_canpark():
     """Can telescope park"""
-    if not telescope:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_IMPLEMENTED'], "Telescope not available")
-    return helpers.alpaca_response(True)
+    return helpers.alpaca_response(_TRUE, etag=True)
 
-@app.route('/api/v1/telescope/0/canslew')
+@telescope_bp.route('/canslew')
+@require_telescope
 def telescope_canslew():
     """Can telescope slew"""
-    if not telescope:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_IMPLEMENTED'], "Telescope not available")
-    return helpers.alpaca_response(True)
+    return helpers.alpaca_response(_TRUE, etag=True)
 
-@app.route('/api/v1/telescope/0/canslewaltaz')
+@telescope_bp.route('/canslewaltaz')
+@require_telescope
 def telescope_canslewaltaz():
     """Can telescope slew alt/az"""
-    if not telescope:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_IMPLEMENTED'], "Telescope not available")
-    return helpers.alpaca_response(True)
+    return helpers.alpaca_response(_TRUE, etag=True)
 
-@app.route('/api/v1/telescope/0/cansync')
+@telescope_bp.route('/cansync')
+@require_telescope
 def telescope_cansync():
     """Can telescope sync"""
-    if not telescope:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_IMPLEMENTED'], "Telescope not available")
-    return helpers.alpaca_response(True)
+    return helpers.alpaca_response(_TRUE, etag=True)
 
-@app.route('/api/v1/telescope/0/cansettracking')
+@telescope_bp.route('/cansettracking')
+@require_telescope
 def telescope_cansettracking():
     """Can set tracking"""
-    if not telescope:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_IMPLEMENTED'], "Telescope not available")
-    return helpers.alpaca_response(True)
+    return helpers.alpaca_response(_TRUE, etag=True)
 
-@app.route('/api/v1/telescope/0/moveaxis', methods=['PUT'])
+@telescope_bp.route('/moveaxis', methods=['PUT'])
 @helpers.require_connected('telescope')
 def telescope_moveaxis():
     """Move telescope axis at specified rate"""
-    axis = helpers.get_form_value('Axis', 0, int)
-    rate = helpers.get_form_value('Rate', 0.0, float)
+    axis = _FORM_AXIS()
+    rate = _FORM_RATE()
     
     # Validate axis
     if axis not in [0, 1]:  # 0=Primary/RA, 1=Secondary/Dec
         return helpers.alpaca_error(
-            config.ASCOM_ERROR_CODES['INVALID_VALUE'],
+            _ERR_INVALID_VALUE,
             f"Invalid axis: {axis}"
         )
     
@@ -619,651 +859,526 @@ def telescope_moveaxis():
     telescope.move_axis(axis, rate)
     return helpers.alpaca_response(None)
 
-@app.route('/api/v1/telescope/0/axisrates')
+@telescope_bp.route('/axisrates')
 @helpers.require_connected('telescope')
 def telescope_axisrates():
     """Get available rates for specified axis"""
-    axis = helpers.get_form_value('Axis', 0, int)
+    axis = _FORM_AXIS()
     
     rates = telescope.get_axis_rates(axis)
     return helpers.alpaca_response(rates)
 
-@app.route('/api/v1/telescope/0/canmoveaxis', methods=['GET'])
+@telescope_bp.route('/canmoveaxis', methods=['GET'])
 def telescope_canmoveaxis():
     """Check if MoveAxis is supported"""
-    axis = helpers.get_form_value('Axis', 0, int)
+    axis = _FORM_AXIS()
     
     # Both axes supported
     can_move = axis in [0, 1]
-    return helpers.alpaca_response(can_move)
+    return helpers.alpaca_response(can_move, etag=True)
     
 # ============================================================================
 # CAMERA API - COMMON
 # ============================================================================
 
-@app.route('/api/v1/camera/<int:device_number>/connected', methods=['GET', 'PUT'])
-def camera_connected(device_number):
-    """Get/set camera connection"""
-    camera = get_camera(device_number)
-    if not camera:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_IMPLEMENTED'], "Camera not available")
-    
-    if request.method == 'GET':
-        return helpers.alpaca_response(camera.is_connected)
+@camera_bp.get('/connected')
+@helpers.require_camera
+def camera_connected(device_number, camera):
+    """Get camera connection"""
+    return helpers.alpaca_response(_CAM_IS_CONNECTED(camera))
+
+@camera_bp.put('/connected')
+@helpers.require_camera
+def camera_connected_put(device_number, camera):
+    """Set camera connection"""
+    connected = _FORM_CONNECTED()
+    if connected:
+        camera.connect()
     else:
-        connected = helpers.get_form_value('Connected', False, bool)
-        if connected:
-            camera.connect()
-        else:
-            camera.disconnect()
-        return helpers.alpaca_response(None)
+        camera.disconnect()
+    return helpers.alpaca_response(None)
 
-@app.route('/api/v1/camera/<int:device_number>/name')
-def camera_name(device_number):
+@camera_bp.route('/name')
+@helpers.require_camera
+def camera_name(device_number, camera):
     """Get camera name"""
-    camera = get_camera(device_number)
-    if not camera:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_IMPLEMENTED'], "Camera not available")
-    return helpers.alpaca_response(camera.camera_name)
+    return helpers.alpaca_response(camera.camera_name, etag=True)
 
-@app.route('/api/v1/camera/<int:device_number>/description')
-def camera_description(device_number):
+@camera_bp.route('/description')
+@helpers.require_camera
+def camera_description(device_number, camera):
     """Get camera description"""
-    camera = get_camera(device_number)
-    if not camera:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_IMPLEMENTED'], "Camera not available")
-    return helpers.alpaca_response(camera.description)
+    return helpers.alpaca_response(camera.description, etag=True)
 
-@app.route('/api/v1/camera/<int:device_number>/driverinfo')
-def camera_driverinfo(device_number):
+@camera_bp.route('/driverinfo')
+@helpers.require_camera
+def camera_driverinfo(device_number, camera):
     """Get camera driver info"""
-    camera = get_camera(device_number)
-    if not camera:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_IMPLEMENTED'], "Camera not available")
-    return helpers.alpaca_response(camera.driver_info)
+    return helpers.alpaca_response(camera.driver_info, etag=True)
 
-@app.route('/api/v1/camera/<int:device_number>/driverversion')
-def camera_driverversion(device_number):
+@camera_bp.route('/driverversion')
+@helpers.require_camera
+def camera_driverversion(device_number, camera):
     """Get camera driver version"""
-    camera = get_camera(device_number)
-    if not camera:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_IMPLEMENTED'], "Camera not available")
-    return helpers.alpaca_response(camera.driver_version)
+    return helpers.alpaca_response(camera.driver_version, etag=True)
 
-@app.route('/api/v1/camera/<int:device_number>/interfaceversion')
+@camera_bp.route('/interfaceversion')
 def camera_interfaceversion(device_number):
     """Get camera interface version"""
-    return helpers.alpaca_response(4)
+    return helpers.alpaca_response(_INTERFACE_VERSION, etag=True)
 
 # ============================================================================
 # CAMERA API - PROPERTIES
 # ============================================================================
 
-@app.route('/api/v1/camera/<int:device_number>/camerastate')
-def camera_camerastate(device_number):
-    """Get camera state"""
-    camera = get_camera(device_number)
-    if not camera or not camera.is_connected:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_CONNECTED'], "Camera not connected")
-    return helpers.alpaca_response(camera.camera_state)
-
-@app.route('/api/v1/camera/<int:device_number>/cameraxsize')
-def camera_cameraxsize(device_number):
-    """Get camera X size"""
-    camera = get_camera(device_number)
-    if not camera or not camera.is_connected:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_CONNECTED'], "Camera not connected")
-    return helpers.alpaca_response(camera.camera_xsize)
-
-@app.route('/api/v1/camera/<int:device_number>/cameraysize')
-def camera_cameraysize(device_number):
-    """Get camera Y size"""
-    camera = get_camera(device_number)
-    if not camera or not camera.is_connected:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_CONNECTED'], "Camera not connected")
-    return helpers.alpaca_response(camera.camera_ysize)
-
-@app.route('/api/v1/camera/<int:device_number>/pixelsizex')
-def camera_pixelsizex(device_number):
-    """Get pixel size X"""
-    camera = get_camera(device_number)
-    if not camera or not camera.is_connected:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_CONNECTED'], "Camera not connected")
-    return helpers.alpaca_response(camera.pixel_size_x)
-
-@app.route('/api/v1/camera/<int:device_number>/pixelsizey')
-def camera_pixelsizey(device_number):
-    """Get pixel size Y"""
-    camera = get_camera(device_number)
-    if not camera or not camera.is_connected:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_CONNECTED'], "Camera not connected")
-    return helpers.alpaca_response(camera.pixel_size_y)
-
-@app.route('/api/v1/camera/<int:device_number>/sensortype')
-def camera_sensortype(device_number):
-    """Get sensor type"""
-    camera = get_camera(device_number)
-    if not camera or not camera.is_connected:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_CONNECTED'], "Camera not connected")
-    return helpers.alpaca_response(camera.sensor_type)
-
-# ============================================================================
-# CAMERA API - BINNING
-# ============================================================================
-
-@app.route('/api/v1/camera/<int:device_number>/binx', methods=['GET', 'PUT'])
-def camera_binx(device_number):
-    """Get/set bin X"""
-    camera = get_camera(device_number)
-    if not camera or not camera.is_connected:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_CONNECTED'], "Camera not connected")
+# Read-only camera properties, one GET route per entry (URL segment -> accessor)
+CAMERA_RO_PROPS = {
+    'camerastate': _CAM_CAMERA_STATE,
+    'imageready': _CAM_IMAGE_READY,
+    'percentcompleted': _CAM_PERCENT_COMPLETED,
+    'ccdtemperature': _CAM_CCD_TEMPERATURE,
+    'coolerpower': _CAM_COOLER_POWER,
+}
+
+# Sensor properties fixed for the life of a connection - served with an
+# ETag so pollers can revalidate instead of re-reading them
+CAMERA_SENSOR_PROPS = {
+    'cameraxsize': _CAM_CAMERA_XSIZE,
+    'cameraysize': _CAM_CAMERA_YSIZE,
+    'pixelsizex': _CAM_PIXEL_SIZE_X,
+    'pixelsizey': _CAM_PIXEL_SIZE_Y,
+    'sensortype': _CAM_SENSOR_TYPE,
+    'maxbinx': _CAM_MAX_BIN_X,
+    'maxbiny': _CAM_MAX_BIN_Y,
+    'gainmin': _CAM_GAIN_MIN,
+    'gainmax': _CAM_GAIN_MAX,
+    'offsetmin': _CAM_OFFSET_MIN,
+    'offsetmax': _CAM_OFFSET_MAX,
+}
+
+def _make_camera_property_view(getter, etag=False):
+    """Build the GET view for one read-only camera property"""
+    @helpers.require_camera_connected
+    def view(device_number, camera):
+        return helpers.alpaca_response(getter(camera), etag=etag)
+    return view
+
+for _path, _getter in CAMERA_RO_PROPS.items():
+    camera_bp.add_url_rule(f'/{_path}', endpoint=f'camera_{_path}',
+                           view_func=_make_camera_property_view(_getter))
+
+for _path, _getter in CAMERA_SENSOR_PROPS.items():
+    camera_bp.add_url_rule(f'/{_path}', endpoint=f'camera_{_path}',
+                           view_func=_make_camera_property_view(_getter, etag=True))
+
+# Integer camera settings with GET and PUT:
+# URL segment -> (attribute, form key, default, attribute holding the max)
+CAMERA_RW_PROPS = {
+    'binx': ('bin_x', 'BinX', 1, 'max_bin_x'),
+    'biny': ('bin_y', 'BinY', 1, 'max_bin_y'),
+    'startx': ('start_x', 'StartX', 0, None),
+    'starty': ('start_y', 'StartY', 0, None),
+    'gain': ('gain', 'Gain', 0, None),
+    'offset': ('offset', 'Offset', 0, None),
+}
+
+def _make_camera_setting_views(attr, form_key, default, max_attr):
+    """Build the GET and PUT views for one integer camera setting"""
+    getter = operator.attrgetter(attr)
+    read_form = helpers.make_form_getter(form_key, default, int)
     
-    if request.method == 'GET':
-        return helpers.alpaca_response(camera.bin_x)
-    else:
-        bin_x = helpers.get_form_value('BinX', 1, int)
-        if bin_x < 1 or bin_x > camera.max_bin_x:
-            return helpers.alpaca_error(config.ASCOM_ERROR_CODES['INVALID_VALUE'], f"BinX must be 1-{camera.max_bin_x}")
-        camera.bin_x = bin_x
-        return helpers.alpaca_response(None)
-
-@app.route('/api/v1/camera/<int:device_number>/biny', methods=['GET', 'PUT'])
-def camera_biny(device_number):
-    """Get/set bin Y"""
-    camera = get_camera(device_number)
-    if not camera or not camera.is_connected:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_CONNECTED'], "Camera not connected")
+    @helpers.require_camera_connected
+    def get_view(device_number, camera):
+        return helpers.alpaca_response(getter(camera))
     
-    if request.method == 'GET':
-        return helpers.alpaca_response(camera.bin_y)
-    else:
-        bin_y = helpers.get_form_value('BinY', 1, int)
-        if bin_y < 1 or bin_y > camera.max_bin_y:
-            return helpers.alpaca_error(config.ASCOM_ERROR_CODES['INVALID_VALUE'], f"BinY must be 1-{camera.max_bin_y}")
-        camera.bin_y = bin_y
+    @helpers.require_camera_connected
+    @helpers.camera_write
+    def put_view(device_number, camera):
+        value = read_form()
+        if max_attr is not None:
+            max_value = getattr(camera, max_attr)
+            if value < 1 or value > max_value:
+                return helpers.alpaca_error(_ERR_INVALID_VALUE, f"{form_key} must be 1-{max_value}")
+        setattr(camera, attr, value)
         return helpers.alpaca_response(None)
+    
+    return get_view, put_view
 
-@app.route('/api/v1/camera/<int:device_number>/maxbinx')
-def camera_maxbinx(device_number):
-    """Get max bin X"""
-    camera = get_camera(device_number)
-    if not camera or not camera.is_connected:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_CONNECTED'], "Camera not connected")
-    return helpers.alpaca_response(camera.max_bin_x)
-
-@app.route('/api/v1/camera/<int:device_number>/maxbiny')
-def camera_maxbiny(device_number):
-    """Get max bin Y"""
-    camera = get_camera(device_number)
-    if not camera or not camera.is_connected:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_CONNECTED'], "Camera not connected")
-    return helpers.alpaca_response(camera.max_bin_y)
+for _path, _spec in CAMERA_RW_PROPS.items():
+    _get_view, _put_view = _make_camera_setting_views(*_spec)
+    camera_bp.add_url_rule(f'/{_path}', endpoint=f'camera_{_path}',
+                           view_func=_get_view, methods=['GET'])
+    camera_bp.add_url_rule(f'/{_path}', endpoint=f'camera_{_path}_put',
+                           view_func=_put_view, methods=['PUT'])
 
 # ============================================================================
 # CAMERA API - ROI
 # ============================================================================
 
-@app.route('/api/v1/camera/<int:device_number>/startx', methods=['GET', 'PUT'])
-def camera_startx(device_number):
-    """Get/set start X"""
-    camera = get_camera(device_number)
-    if not camera or not camera.is_connected:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_CONNECTED'], "Camera not connected")
-    
-    if request.method == 'GET':
-        return helpers.alpaca_response(camera.start_x)
-    else:
-        camera.start_x = helpers.get_form_value('StartX', 0, int)
-        return helpers.alpaca_response(None)
-
-@app.route('/api/v1/camera/<int:device_number>/starty', methods=['GET', 'PUT'])
-def camera_starty(device_number):
-    """Get/set start Y"""
-    camera = get_camera(device_number)
-    if not camera or not camera.is_connected:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_CONNECTED'], "Camera not connected")
-    
-    if request.method == 'GET':
-        return helpers.alpaca_response(camera.start_y)
-    else:
-        camera.start_y = helpers.get_form_value('StartY', 0, int)
-        return helpers.alpaca_response(None)
-
-@app.route('/api/v1/camera/<int:device_number>/numx', methods=['GET', 'PUT'])
-def camera_numx(device_number):
-    """Get/set num X"""
-    camera = get_camera(device_number)
-    if not camera or not camera.is_connected:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_CONNECTED'], "Camera not connected")
-    
-    if request.method == 'GET':
-        return helpers.alpaca_response(camera.num_x)
-    else:
-        camera.num_x = helpers.get_form_value('NumX', camera.camera_xsize, int)
-        return helpers.alpaca_response(None)
+@camera_bp.get('/numx')
+@helpers.require_camera_connected
+def camera_numx(device_number, camera):
+    """Get num X"""
+    return helpers.alpaca_response(_CAM_NUM_X(camera))
+
+@camera_bp.put('/numx')
+@helpers.require_camera_connected
+@helpers.camera_write
+def camera_numx_put(device_number, camera):
+    """Set num X"""
+    num_x = _FORM_NUM_X()
+    camera.num_x = camera.camera_xsize if num_x is None else num_x
+    return helpers.alpaca_response(None)
 
-@app.route('/api/v1/camera/<int:device_number>/numy', methods=['GET', 'PUT'])
-def camera_numy(device_number):
-    """Get/set num Y"""
-    camera = get_camera(device_number)
-    if not camera or not camera.is_connected:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_CONNECTED'], "Camera not connected")
-    
-    if request.method == 'GET':
-        return helpers.alpaca_response(camera.num_y)
-    else:
-        camera.num_y = helpers.get_form_value('NumY', camera.camera_ysize, int)
-        return helpers.alpaca_response(None)
+@camera_bp.get('/numy')
+@helpers.require_camera_connected
+def camera_numy(device_number, camera):
+    """Get num Y"""
+    return helpers.alpaca_response(_CAM_NUM_Y(camera))
+
+@camera_bp.put('/numy')
+@helpers.require_camera_connected
+@helpers.camera_write
+def camera_numy_put(device_number, camera):
+    """Set num Y"""
+    num_y = _FORM_NUM_Y()
+    camera.num_y = camera.camera_ysize if num_y is None else num_y
+    return helpers.alpaca_response(None)
 
 # ============================================================================
 # CAMERA API - EXPOSURE
 # ============================================================================
 
-@app.route('/api/v1/camera/<int:device_number>/startexposure', methods=['PUT'])
-def camera_startexposure(device_number):
+@camera_bp.route('/startexposure', methods=['PUT'])
+@helpers.require_camera_connected
+@helpers.camera_write
+def camera_startexposure(device_number, camera):
     """Start exposure"""
-    camera = get_camera(device_number)
-    if not camera or not camera.is_connected:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_CONNECTED'], "Camera not connected")
-    
-    duration = helpers.get_form_value('Duration', 1.0, float)
-    is_light = helpers.get_form_value('Light', True, bool)
+    duration = _FORM_DURATION()
+    is_light = _FORM_LIGHT()
     
     try:
         camera.start_exposure(duration, is_light)
         return helpers.alpaca_response(None)
     except Exception as e:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['UNSPECIFIED_ERROR'], str(e))
+        return helpers.alpaca_error(_ERR_UNSPECIFIED, str(e))
 
-@app.route('/api/v1/camera/<int:device_number>/abortexposure', methods=['PUT'])
-def camera_abortexposure(device_number):
+@camera_bp.route('/abortexposure', methods=['PUT'])
+@helpers.require_camera_connected
+def camera_abortexposure(device_number, camera):
     """Abort exposure"""
-    camera = get_camera(device_number)
-    if not camera or not camera.is_connected:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_CONNECTED'], "Camera not connected")
-    
     camera.abort_exposure()
     return helpers.alpaca_response(None)
 
-@app.route('/api/v1/camera/<int:device_number>/stopexposure', methods=['PUT'])
-def camera_stopexposure(device_number):
+@camera_bp.route('/stopexposure', methods=['PUT'])
+@helpers.require_camera_connected
+def camera_stopexposure(device_number, camera):
     """Stop exposure"""
-    camera = get_camera(device_number)
-    if not camera or not camera.is_connected:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_CONNECTED'], "Camera not connected")
-    
     camera.stop_exposure()
     return helpers.alpaca_response(None)
 
-@app.route('/api/v1/camera/<int:device_number>/imageready')
-def camera_imageready(device_number):
-    """Get image ready status"""
-    camera = get_camera(device_number)
-    if not camera or not camera.is_connected:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_CONNECTED'], "Camera not connected")
-    return helpers.alpaca_response(camera.image_ready)
-
-@app.route('/api/v1/camera/<int:device_number>/percentcompleted')
-def camera_percentcompleted(device_number):
-    """Get exposure percent completed"""
-    camera = get_camera(device_number)
-    if not camera or not camera.is_connected:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_CONNECTED'], "Camera not connected")
-    return helpers.alpaca_response(camera.percent_completed)
-
 # ============================================================================
 # CAMERA API - IMAGE DATA
 # ============================================================================
 
-@app.route('/api/v1/camera/<int:device_number>/imagearray')
-def camera_imagearray(device_number):
-    """Get image as 2D array (JSON)"""
-    camera = get_camera(device_number)
-    if not camera or not camera.is_connected:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_CONNECTED'], "Camera not connected")
-    
+@camera_bp.route('/imagearray')
+@helpers.require_camera_connected
+def camera_imagearray(device_number, camera):
+    """Get image as 2D array (JSON, or ImageBytes if the client accepts it)"""
+    imagebytes = helpers.accepts_imagebytes()
     try:
-        img = camera.get_image_array()
-        img_list = img.tolist()
-        return helpers.alpaca_response(img_list)
+        img = camera.get_image_buffer()
+        if imagebytes:
+            return helpers.imagebytes_response(img)
+        return helpers.compress_response(helpers.imagearray_response(img))
     except Exception as e:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['UNSPECIFIED_ERROR'], str(e))
-
-@app.route('/api/v1/camera/<int:device_number>/imagearrayvariant')
-def camera_imagearrayvariant(device_number):
-    """Get image as Base64 encoded string"""
-    camera = get_camera(device_number)
-    if not camera or not camera.is_connected:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_CONNECTED'], "Camera not connected")
-    
+        if imagebytes:
+            return helpers.imagebytes_error(_ERR_UNSPECIFIED, str(e))
+        return helpers.alpaca_error(_ERR_UNSPECIFIED, str(e))
+
+@camera_bp.route('/imagearrayvariant')
+@helpers.require_camera_connected
+def camera_imagearrayvariant(device_number, camera):
+    """Get image as Base64 encoded string (or ImageBytes if the client accepts it)"""
+    imagebytes = helpers.accepts_imagebytes()
     try:
-        img = camera.get_image_array()
-        img_bytes = img.tobytes()
-        img_b64 = base64.b64encode(img_bytes).decode('ascii')
-        
-        result = {
-            'Type': 'UInt16',
-            'Rank': 2,
-            'Data': img_b64,
-            'Width': img.shape[1],
-            'Height': img.shape[0]
-        }
-        return helpers.alpaca_response(result)
+        img = camera.get_image_buffer()
+        if imagebytes:
+            return helpers.imagebytes_response(img)
+        # Encode straight from the (already contiguous) frame buffer - no tobytes()
+        # copy - and splice the Base64 bytes into a prebuilt Value, so the
+        # string is never decoded or re-scanned by the JSON encoder
+        height, width = img.shape
+        img_b64 = base64.b64encode(np.ascontiguousarray(img, dtype='<u2').data)
+        result = helpers.EncodedJSON(b''.join((
+            b'{"Type":"UInt16","Rank":2,"Data":"',
+            img_b64,
+            b'","Width":%d,"Height":%d}' % (width, height)
+        )))
+        return helpers.compress_response(helpers.alpaca_response(result))
     except Exception as e:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['UNSPECIFIED_ERROR'], str(e))
+        if imagebytes:
+            return helpers.imagebytes_error(_ERR_UNSPECIFIED, str(e))
+        return helpers.alpaca_error(_ERR_UNSPECIFIED, str(e))
 
 # ============================================================================
-# CAMERA API - GAIN & OFFSET
+# CAMERA API - TEMPERATURE
 # ============================================================================
 
-@app.route('/api/v1/camera/<int:device_number>/gain', methods=['GET', 'PUT'])
-def camera_gain(device_number):
-    """Get/set gain"""
-    camera = get_camera(device_number)
-    if not camera or not camera.is_connected:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_CONNECTED'], "Camera not connected")
+@camera_bp.get('/cooleron')
+@helpers.require_camera_connected
+def camera_cooleron(device_number, camera):
+    """Get cooler on"""
+    return helpers.alpaca_response(_CAM_COOLER_ON(camera))
+
+@camera_bp.put('/cooleron')
+@helpers.require_camera_connected
+@helpers.camera_write
+def camera_cooleron_put(device_number, camera):
+    """Set cooler on"""
+    if not camera.can_set_ccd_temperature:
+        return helpers.alpaca_error(_ERR_NOT_IMPLEMENTED, "Cooler not supported")
     
-    if request.method == 'GET':
-        return helpers.alpaca_response(camera.gain)
-    else:
-        gain = helpers.get_form_value('Gain', 0, int)
-        camera.gain = gain
-        return helpers.alpaca_response(None)
+    cooler_on = _FORM_COOLER_ON()
+    camera.set_cooler(cooler_on)
+    return helpers.alpaca_response(None)
 
-@app.route('/api/v1/camera/<int:device_number>/gainmin')
-def camera_gainmin(device_number):
-    """Get min gain"""
-    camera = get_camera(device_number)
-    if not camera or not camera.is_connected:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_CONNECTED'], "Camera not connected")
-    return helpers.alpaca_response(camera.gain_min)
-
-@app.route('/api/v1/camera/<int:device_number>/gainmax')
-def camera_gainmax(device_number):
-    """Get max gain"""
-    camera = get_camera(device_number)
-    if not camera or not camera.is_connected:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_CONNECTED'], "Camera not connected")
-    return helpers.alpaca_response(camera.gain_max)
-
-@app.route('/api/v1/camera/<int:device_number>/offset', methods=['GET', 'PUT'])
-def camera_offset(device_number):
-    """Get/set offset"""
-    camera = get_camera(device_number)
-    if not camera or not camera.is_connected:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_CONNECTED'], "Camera not connected")
+@camera_bp.get('/setccdtemperature')
+@helpers.require_camera_connected
+def camera_setccdtemperature(device_number, camera):
+    """Get target CCD temperature"""
+    return helpers.alpaca_response(_CAM_SET_CCD_TEMPERATURE(camera))
+
+@camera_bp.put('/setccdtemperature')
+@helpers.require_camera_connected
+@helpers.camera_write
+def camera_setccdtemperature_put(device_number, camera):
+    """Set target CCD temperature"""
+    if not camera.can_set_ccd_temperature:
+        return helpers.alpaca_error(_ERR_NOT_IMPLEMENTED, "Temperature control not supported")
     
-    if request.method == 'GET':
-        return helpers.alpaca_response(camera.offset)
-    else:
-        offset = helpers.get_form_value('Offset', 0, int)
-        camera.offset = offset
-        return helpers.alpaca_response(None)
-
-@app.route('/api/v1/camera/<int:device_number>/offsetmin')
-def camera_offsetmin(device_number):
-    """Get min offset"""
-    camera = get_camera(device_number)
-    if not camera or not camera.is_connected:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_CONNECTED'], "Camera not connected")
-    return helpers.alpaca_response(camera.offset_min)
-
-@app.route('/api/v1/camera/<int:device_number>/offsetmax')
-def camera_offsetmax(device_number):
-    """Get max offset"""
-    camera = get_camera(device_number)
-    if not camera or not camera.is_connected:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_CONNECTED'], "Camera not connected")
-    return helpers.alpaca_response(camera.offset_max)
+    temp = _FORM_SET_CCD_TEMPERATURE()
+    camera.set_target_temperature(temp)
+    return helpers.alpaca_response(None)
 
 # ============================================================================
-# CAMERA API - TEMPERATURE
+# CAMERA API - DEVICE STATE
 # ============================================================================
 
-@app.route('/api/v1/camera/<int:device_number>/ccdtemperature')
-def camera_ccdtemperature(device_number):
-    """Get CCD temperature"""
-    camera = get_camera(device_number)
-    if not camera or not camera.is_connected:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_CONNECTED'], "Camera not connected")
-    return helpers.alpaca_response(camera.ccd_temperature)
-
-@app.route('/api/v1/camera/<int:device_number>/cooleron', methods=['GET', 'PUT'])
-def camera_cooleron(device_number):
-    """Get/set cooler on"""
-    camera = get_camera(device_number)
-    if not camera or not camera.is_connected:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_CONNECTED'], "Camera not connected")
-    
-    if request.method == 'GET':
-        return helpers.alpaca_response(camera.cooler_on)
-    else:
-        if not camera.can_set_ccd_temperature:
-            return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_IMPLEMENTED'], "Cooler not supported")
-        
-        cooler_on = helpers.get_form_value('CoolerOn', False, bool)
-        camera.set_cooler(cooler_on)
-        return helpers.alpaca_response(None)
-
-@app.route('/api/v1/camera/<int:device_number>/coolerpower')
-def camera_coolerpower(device_number):
-    """Get cooler power"""
-    camera = get_camera(device_number)
-    if not camera or not camera.is_connected:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_CONNECTED'], "Camera not connected")
-    return helpers.alpaca_response(camera.cooler_power)
-
-@app.route('/api/v1/camera/<int:device_number>/setccdtemperature', methods=['GET', 'PUT'])
-def camera_setccdtemperature(device_number):
-    """Get/set target CCD temperature"""
-    camera = get_camera(device_number)
-    if not camera or not camera.is_connected:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_CONNECTED'], "Camera not connected")
-    
-    if request.method == 'GET':
-        return helpers.alpaca_response(camera.set_ccd_temperature)
-    else:
-        if not camera.can_set_ccd_temperature:
-            return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_IMPLEMENTED'], "Temperature control not supported")
-        
-        temp = helpers.get_form_value('SetCCDTemperature', 0.0, float)
-        camera.set_target_temperature(temp)
-        return helpers.alpaca_response(None)
+# Properties reported by devicestate (Alpaca name -> accessor)
+CAMERA_DEVICE_STATE = {
+    'CameraState': _CAM_CAMERA_STATE,
+    'CCDTemperature': _CAM_CCD_TEMPERATURE,
+    'CoolerPower': _CAM_COOLER_POWER,
+    'ImageReady': _CAM_IMAGE_READY,
+    'PercentCompleted': _CAM_PERCENT_COMPLETED,
+}
+
+@camera_bp.route('/devicestate')
+@helpers.require_camera_connected
+def camera_devicestate(device_number, camera):
+    """Get the commonly polled camera properties in one response"""
+    return helpers.alpaca_response(helpers.device_state(
+        {name: getter(camera) for name, getter in CAMERA_DEVICE_STATE.items()}))
 
 # ============================================================================
 # CAMERA API - CAPABILITIES
 # ============================================================================
 
-@app.route('/api/v1/camera/<int:device_number>/canabortexposure')
-def camera_canabortexposure(device_number):
-    camera = get_camera(device_number)
-    if not camera:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_IMPLEMENTED'], "Camera not found")
-    return helpers.alpaca_response(camera.can_abort_exposure)
-
-@app.route('/api/v1/camera/<int:device_number>/canstopexposure')
-def camera_canstopexposure(device_number):
-    camera = get_camera(device_number)
-    if not camera:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_IMPLEMENTED'], "Camera not found")
-    return helpers.alpaca_response(camera.can_stop_exposure)
-
-@app.route('/api/v1/camera/<int:device_number>/cansetccdtemperature')
-def camera_cansetccdtemperature(device_number):
-    camera = get_camera(device_number)
-    if not camera:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_IMPLEMENTED'], "Camera not found")
-    return helpers.alpaca_response(camera.can_set_ccd_temperature)
+# Static capability flags (URL segment -> camera attribute), answered even
+# while the camera is disconnected
+CAMERA_CAPABILITIES = {
+    'canabortexposure': 'can_abort_exposure',
+    'canstopexposure': 'can_stop_exposure',
+    'cansetccdtemperature': 'can_set_ccd_temperature',
+}
+
+def _make_camera_capability_view(getter):
+    """Build the GET view for one camera capability flag"""
+    @helpers.require_camera
+    def view(device_number, camera):
+        return helpers.alpaca_response(getter(camera), etag=True)
+    return view
+
+for _path, _attr in CAMERA_CAPABILITIES.items():
+    camera_bp.add_url_rule(f'/{_path}', endpoint=f'camera_{_path}',
+                           view_func=_make_camera_capability_view(operator.attrgetter(_attr)))
 
 # ============================================================================
 # FILTERWHEEL API
 # ============================================================================
 
-@app.route('/api/v1/filterwheel/0/connected', methods=['GET', 'PUT'])
+@filterwheel_bp.get('/connected')
+@require_filterwheel
 def filterwheel_connected():
-    """Get/set filter wheel connection"""
-    if not filterwheel:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_IMPLEMENTED'], "FilterWheel not available")
-    
-    if request.method == 'GET':
-        return helpers.alpaca_response(filterwheel.is_connected)
+    """Get filter wheel connection"""
+    return helpers.alpaca_response(filterwheel.is_connected)
+
+@filterwheel_bp.put('/connected')
+@require_filterwheel
+def filterwheel_connected_put():
+    """Set filter wheel connection"""
+    connected = _FORM_CONNECTED()
+    if connected:
+        filterwheel.connect()
     else:
-        connected = helpers.get_form_value('Connected', False, bool)
-        if connected:
-            filterwheel.connect()
-        else:
-            filterwheel.disconnect()
-        return helpers.alpaca_response(None)
+        filterwheel.disconnect()
+    return helpers.alpaca_response(None)
 
-@app.route('/api/v1/filterwheel/0/name')
+@filterwheel_bp.route('/name')
+@require_filterwheel
 def filterwheel_name():
     """Get filter wheel name"""
-    if not filterwheel:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_IMPLEMENTED'], "FilterWheel not available")
-    return helpers.alpaca_response(config.DEVICES['filterwheel']['name'])
+    return helpers.alpaca_response(_FILTERWHEEL_NAME, etag=True)
 
-@app.route('/api/v1/filterwheel/0/description')
+@filterwheel_bp.route('/description')
+@require_filterwheel
 def filterwheel_description():
     """Get filter wheel description"""
-    if not filterwheel:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_IMPLEMENTED'], "FilterWheel not available")
-    return helpers.alpaca_response("ZWO Electronic Filter Wheel")
+    return helpers.alpaca_response(_FILTERWHEEL_DESCRIPTION, etag=True)
 
-@app.route('/api/v1/filterwheel/0/position', methods=['GET', 'PUT'])
+@filterwheel_bp.get('/position')
 @helpers.require_connected('filterwheel')
 def filterwheel_position():
-    """Get/set filter position"""
-    if request.method == 'GET':
-        return helpers.alpaca_response(filterwheel.get_position())
-    else:
-        position = helpers.get_form_value('Position', 0, int)
-        filterwheel.set_position(position)
-        return helpers.alpaca_response(None)
+    """Get filter position"""
+    return helpers.alpaca_response(filterwheel.get_position())
 
-@app.route('/api/v1/filterwheel/0/names')
+@filterwheel_bp.put('/position')
+@helpers.require_connected('filterwheel')
+def filterwheel_position_put():
+    """Set filter position"""
+    position = _FORM_POSITION()
+    filterwheel.set_position(position)
+    return helpers.alpaca_response(None)
+
+@filterwheel_bp.route('/names')
 @helpers.require_connected('filterwheel')
 def filterwheel_names():
     """Get filter names"""
-    names = [filterwheel.get_filter_name(i) for i in range(filterwheel.slot_count)]
-    return helpers.alpaca_response(names)
+    return helpers.alpaca_response(filterwheel.get_filter_names(), etag=True)
 
-@app.route('/api/v1/filterwheel/0/focusoffsets')
+@filterwheel_bp.route('/focusoffsets')
 @helpers.require_connected('filterwheel')
 def filterwheel_focusoffsets():
     """Get focus offsets"""
-    offsets = [filterwheel.get_focus_offset(i) for i in range(filterwheel.slot_count)]
-    return helpers.alpaca_response(offsets)
+    return helpers.alpaca_response(filterwheel.get_focus_offsets(), etag=True)
 
 # ============================================================================
 # FOCUSER API
 # ============================================================================
 
-@app.route('/api/v1/focuser/0/connected', methods=['GET', 'PUT'])
+@focuser_bp.get('/connected')
+@require_focuser
 def focuser_connected():
-    """Get/set focuser connection"""
-    if not focuser:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_IMPLEMENTED'], "Focuser not available")
-    
-    if request.method == 'GET':
-        return helpers.alpaca_response(focuser.is_connected)
+    """Get focuser connection"""
+    return helpers.alpaca_response(focuser.is_connected)
+
+@focuser_bp.put('/connected')
+@require_focuser
+def focuser_connected_put():
+    """Set focuser connection"""
+    connected = _FORM_CONNECTED()
+    if connected:
+        focuser.connect()
     else:
-        connected = helpers.get_form_value('Connected', False, bool)
-        if connected:
-            focuser.connect()
-        else:
-            focuser.disconnect()
-        return helpers.alpaca_response(None)
+        focuser.disconnect()
+    return helpers.alpaca_response(None)
 
-@app.route('/api/v1/focuser/0/name')
+@focuser_bp.route('/name')
+@require_focuser
 def focuser_name():
     """Get focuser name"""
-    if not focuser:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_IMPLEMENTED'], "Focuser not available")
-    return helpers.alpaca_response(config.DEVICES['focuser']['name'])
+    return helpers.alpaca_response(_FOCUSER_NAME, etag=True)
 
-@app.route('/api/v1/focuser/0/description')
+@focuser_bp.route('/description')
+@require_focuser
 def focuser_description():
     """Get focuser description"""
-    if not focuser:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_IMPLEMENTED'], "Focuser not available")
-    return helpers.alpaca_response("ZWO Electronic Auto Focuser")
+    return helpers.alpaca_response(_FOCUSER_DESCRIPTION, etag=True)
 
-@app.route('/api/v1/focuser/0/absolute', methods=['GET'])
+@focuser_bp.route('/absolute', methods=['GET'])
+@require_focuser
 def focuser_absolute():
     """Is focuser absolute"""
-    if not focuser:
-        return helpers.alpaca_error(config.ASCOM_ERROR_CODES['NOT_IMPLEMENTED'], "Focuser not available")
-    return helpers.alpaca_response(True)
+    return helpers.alpaca_response(_TRUE, etag=True)
 
-@app.route('/api/v1/focuser/0/ismoving')
+@focuser_bp.route('/ismoving')
 @helpers.require_connected('focuser')
 def focuser_ismoving():
     """Is focuser moving"""
     return helpers.alpaca_response(focuser.is_moving())
 
-@app.route('/api/v1/focuser/0/maxstep')
+@focuser_bp.route('/maxstep')
 @helpers.require_connected('focuser')
 def focuser_maxstep():
     """Get max step"""
-    return helpers.alpaca_response(focuser.max_position)
+    return helpers.alpaca_response(focuser.max_position, etag=True)
 
-@app.route('/api/v1/focuser/0/position')
+@focuser_bp.route('/position')
 @helpers.require_connected('focuser')
 def focuser_position():
     """Get current position"""
     return helpers.alpaca_response(focuser.get_position())
 
-@app.route('/api/v1/focuser/0/move', methods=['PUT'])
+@focuser_bp.route('/move', methods=['PUT'])
 @helpers.require_connected('focuser')
 def focuser_move():
     """Move to absolute position"""
-    position = helpers.get_form_value('Position', 0, int)
-    focuser.move_to(position)
+    position = _FORM_POSITION()
+    focuser.start_move(position)
     return helpers.alpaca_response(None)
 
-@app.route('/api/v1/focuser/0/halt', methods=['PUT'])
+@focuser_bp.route('/halt', methods=['PUT'])
 @helpers.require_connected('focuser')
 def focuser_halt():
     """Halt movement"""
     focuser.halt()
     return helpers.alpaca_response(None)
 
-@app.route('/api/v1/focuser/0/temperature')
+@focuser_bp.route('/temperature')
 @helpers.require_connected('focuser')
 def focuser_temperature():
     """Get temperature"""
     return helpers.alpaca_response(focuser.get_temperature())
 
-@app.route('/api/v1/focuser/0/tempcomp', methods=['GET', 'PUT'])
+@focuser_bp.get('/tempcomp')
 @helpers.require_connected('focuser')
 def focuser_tempcomp():
-    """Get/set temperature compensation"""
-    if request.method == 'GET':
-        return helpers.alpaca_response(focuser.temp_comp_enabled)
-    else:
-        enabled = helpers.get_form_value('TempComp', False, bool)
-        focuser.set_temp_compensation(enabled)
-        return helpers.alpaca_response(None)
+    """Get temperature compensation"""
+    return helpers.alpaca_response(focuser.temp_comp_enabled)
+
+@focuser_bp.put('/tempcomp')
+@helpers.require_connected('focuser')
+def focuser_tempcomp_put():
+    """Set temperature compensation"""
+    enabled = _FORM_TEMP_COMP()
+    focuser.set_temp_compensation(enabled)
+    return helpers.alpaca_response(None)
+
+for _bp in (telescope_bp, camera_bp, filterwheel_bp, focuser_bp):
+    app.register_blueprint(_bp)
 
 # ============================================================================
 # MAIN ENTRY POINT
 # ============================================================================
 
 if __name__ == '__main__':
-    print("=" * 60)
-    print("OnStepX Alpaca Bridge - Complete Server with Discovery")
-    print("=" * 60)
+    log_listener = setup_logging()
+    
+    logger.info("\n".join([
+        "=" * 60,
+        "OnStepX Alpaca Bridge - Complete Server with Discovery",
+        "=" * 60
+    ]))
     
     # Initialize devices
     init_devices()
     
-    print("\n" + "=" * 60)
-    print("Device initialization complete!")
-    print("=" * 60)
+    logger.info("Device initialization complete!")
     
     # Start discovery service
     if config.ENABLE_DISCOVERY:
-        print("\nStarting UDP Discovery Service...")
+        logger.info("Starting UDP Discovery Service...")
         discovery = AlpacaDiscovery(
             #port=config.DISCOVERY_PORT,
             #alpaca_port=config.SERVER_PORT
@@ -1273,37 +1388,55 @@ if __name__ == '__main__':
         )
         discovery.start()
         
-        print(f"✓ Discovery service running on UDP port {config.DISCOVERY_PORT}")
-        print("  Clients can now auto-discover this server!")
+        logger.info(f"✓ Discovery service running on UDP port {config.DISCOVERY_PORT} - "
+                    "clients can now auto-discover this server!")
 
     # Setup signal handler for clean shutdown
     def signal_handler(sig, frame):
-        print("\n\nShutting down gracefully...")
+        logger.info("Shutting down gracefully...")
         if discovery:
             discovery.stop()
+        log_listener.stop()
         sys.exit(0)
     
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
     
     # Start HTTP server
-    print("\nHTTP Server starting...")
-    print(f"Host: {config.SERVER_HOST}")
-    print(f"Port: {config.SERVER_PORT}")
-    print(f"\nAccess from network: http://<pi-ip>:{config.SERVER_PORT}")
+    banner = [
+        "HTTP Server starting...",
+        f"Host: {config.SERVER_HOST}",
+        f"Port: {config.SERVER_PORT}",
+        f"Access from network: http://<pi-ip>:{config.SERVER_PORT}",
+    ]
     if config.ENABLE_DISCOVERY:
-        print("N.I.N.A. should now auto-discover this server!")
-    print("=" * 60)
-    print("\nPress Ctrl+C to stop\n")
+        banner.append("N.I.N.A. should now auto-discover this server!")
+    banner += ["=" * 60, "Press Ctrl+C to stop"]
+    logger.info("\n".join(banner))
     
-    # Run Flask app
+    # Run Flask app - waitress when installed, Werkzeug dev server otherwise
     try:
-        app.run(
-            host=config.SERVER_HOST,
-            port=config.SERVER_PORT,
-            debug=config.DEBUG_MODE,
-            use_reloader=False  # Disable reloader to avoid double initialization
-        )
+        if WAITRESS_AVAILABLE and not config.DEBUG_MODE:
+            serve(
+                app,
+                host=config.SERVER_HOST,
+                port=config.SERVER_PORT,
+                threads=config.HTTP_THREADS,
+                connection_limit=config.HTTP_CONNECTION_LIMIT,
+                channel_timeout=60
+            )
+        else:
+            if not config.DEBUG_MODE:
+                logger.warning("waitress is not installed - falling back to the "
+                               "Werkzeug development server (pip install waitress)")
+            app.run(
+                host=config.SERVER_HOST,
+                port=config.SERVER_PORT,
+                debug=config.DEBUG_MODE,
+                threaded=True,      # One thread per request - devices are polled in parallel
+                use_reloader=False  # Disable reloader to avoid double initialization
+            )
     finally:
         if discovery:
             discovery.stop()
+        log_listener.stop()
@@ -10,7 +10,9 @@ import serial.tools.list_ports
 import socket
 import time
 import math
-from threading import Lock
+import queue
+from concurrent.futures import Future
+from threading import Thread
 from enum import IntEnum
 from datetime import datetime, timezone
 import alpaca_helpers as helpers
@@ -55,19 +57,26 @@ class TrackingRate:
     LUNAR_RATIO = LUNAR_RATE / SIDEREAL_RATE      # 0.96367
     KING_RATIO = KING_RATE / SIDEREAL_RATE        # 1.00274
     
+    # Canonical rate -> name, in the order they are matched
+    RATE_NAMES = {
+        SIDEREAL_RATE: "Sidereal",
+        SOLAR_RATE: "Solar",
+        LUNAR_RATE: "Lunar",
+        KING_RATE: "King",
+    }
+    
     @staticmethod
     def get_rate_name(rate):
         """Get the name of a tracking rate"""
-        if abs(rate - SIDEREAL_RATE) < 0.000001:
-            return "Sidereal"
-        elif abs(rate - SOLAR_RATE) < 0.000001:
-            return "Solar"
-        elif abs(rate - LUNAR_RATE) < 0.000001:
-            return "Lunar"
-        elif abs(rate - KING_RATE) < 0.000001:
-            return "King"
-        else:
-            return f"Custom ({rate:.6f}°/s)"
+        # The constants themselves are the common case - one dict probe
+        name = TrackingRate.RATE_NAMES.get(rate)
+        if name is not None:
+            return name
+        
+        for known_rate, name in TrackingRate.RATE_NAMES.items():
+            if abs(rate - known_rate) < 0.000001:
+                return name
+        return f"Custom ({rate:.6f}°/s)"
 
 # ========================================================================
 # Sidereal Rate Multipliers (for manual control rates)
@@ -124,8 +133,51 @@ class TelescopeAxes(IntEnum):
 class OnStepXMount:
     """OnStepX telescope mount driver - supports Network and USB"""
     
+    # Command worker settings
+    COMMAND_TIMEOUT = 5.0   # Seconds a caller waits for its reply
+    MAX_BATCH = 8           # Queued requests drained per worker pass
+    PIPELINE_WINDOW = 0.005 # Seconds to wait for more queries to pipeline
+    MAX_REPLY = 1024        # Bytes read for one reply at most
+    REPLY_TIMEOUT = 2.0     # Seconds to wait for a network reply
+    KEEPALIVE_INTERVAL = 30.0   # Idle seconds before the worker pings the mount
+    
+    # Command prefix for a guide pulse in each direction (duration follows)
+    GUIDE_COMMANDS = {
+        GuideDirections.guideNorth: ':Mgn',
+        GuideDirections.guideSouth: ':Mgs',
+        GuideDirections.guideEast: ':Mge',
+        GuideDirections.guideWest: ':Mgw',
+    }
+    
+    TRACKING_RATE_COMMANDS = {
+        DriveRates.driveSidereal: ':TQ#',
+        DriveRates.driveLunar: ':TL#',
+        DriveRates.driveSolar: ':TS#',
+    }
+    
+    # Commands OnStepX answers with a single character and no '#': the
+    # target setters ('0'/'1') and the gotos (0 = started, else error code)
+    ONE_CHAR_REPLIES = (':Sr', ':Sd', ':Sz', ':Sa', ':MS', ':MA')
+    
+    # Position polls within this many seconds share one mount query
+    POSITION_CACHE_TTL = 0.2
+    
+    # A sidereal time reading is reused (advanced by the elapsed time) for
+    # this many seconds, so pier side, altitude and limit checks share it
+    LST_CACHE_TTL = 1.0
+    SIDEREAL_HOURS_PER_SECOND = 1.00273790935 / 3600.0
+    
+    # Applied to the network socket before connecting, as
+    # (level, option, value). LX200 commands are a few bytes each, so send
+    # them immediately rather than letting Nagle hold them for the previous
+    # ACK, and notice a mount that drops off WiFi on an otherwise idle link.
+    DEFAULT_SOCKET_OPTIONS = (
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    )
+    
     def __init__(self, connection_type='network', host=None, port=9999, 
-                 serial_port=None, baudrate=9600):
+                 serial_port=None, baudrate=9600, socket_options=None):
         """
         Initialize OnStepX mount driver
         
@@ -135,6 +187,8 @@ class OnStepXMount:
             port: TCP port for network connection (default: 9999)
             serial_port: Serial port for USB connection (e.g., '/dev/ttyUSB0')
             baudrate: Baud rate for serial connection (default: 9600)
+            socket_options: (level, option, value) tuples for the network
+                            socket (default: DEFAULT_SOCKET_OPTIONS)
         """
         self.connection_type = connection_type.lower()
         
@@ -142,6 +196,10 @@ class OnStepXMount:
         self.host = host
         self.port = port
         self.socket = None
+        self._rx = bytearray()      # Received bytes not yet consumed as replies
+        self._rx_chunk = memoryview(bytearray(self.MAX_REPLY))  # recv_into target
+        self.socket_options = (self.DEFAULT_SOCKET_OPTIONS if socket_options is None
+                               else tuple(socket_options))
         
         # Serial settings
         self.serial_port = serial_port
@@ -149,13 +207,17 @@ class OnStepXMount:
         self.serial = None
         
         # Connection state
-        self.lock = Lock()
+        # All traffic goes through a single command worker thread, so callers
+        # never contend on the port - they queue a request and wait for it
+        self._command_queue = None
+        self._command_worker = None
         self.is_connected = False
         self.is_connecting = False
         
         # Mount state
         self.target_ra = 0.0
         self.target_dec = 0.0
+        self._mount_target = [None, None]   # RA/Dec last loaded with :Sr/:Sd
         self.slew_settle_time = 0
         self.tracking_rate = DriveRates.driveSidereal
         self.guide_rate_ra = 0.5
@@ -175,7 +237,9 @@ class OnStepXMount:
         self._last_position = None
         self._slew_timeout = 120  # 2 minutes max slew time
         self._stability_threshold = 1.0  # arcminutes
+        self._stability_threshold_sq = self._stability_threshold ** 2
         self._stability_duration = 2.0   # seconds
+        self._lst_reading = (0.0, float('-inf'))  # (LST hours, time.monotonic())
         
         # Mount info
         self.site_latitude = 0.0
@@ -210,6 +274,7 @@ class OnStepXMount:
     def connect(self):
         """Connect to mount (network or serial)"""
         self.is_connecting = True
+        self._mount_target = [None, None]   # A rebooted mount holds no target
         try:
             if self.connection_type == 'network':
                 return self._connect_network()
@@ -230,10 +295,8 @@ class OnStepXMount:
             
             print(f"Connecting to OnStepX at {self.host}:{self.port}...")
             
-            # Create TCP socket
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.settimeout(5.0)
-            self.socket.connect((self.host, self.port))
+            self.socket = self._open_socket()
+            self._start_command_worker()
             
             # Test connection
             product = self.send_command(':GVP#')
@@ -262,6 +325,19 @@ class OnStepXMount:
             self.is_connected = False
             return False
     
+    def _open_socket(self):
+        """Open a configured TCP connection to the mount"""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            for level, option, value in self.socket_options:
+                sock.setsockopt(level, option, value)
+            sock.settimeout(5.0)
+            sock.connect((self.host, self.port))
+        except OSError:
+            sock.close()
+            raise
+        return sock
+    
     def _connect_serial(self):
         """Connect via USB serial"""
         try:
@@ -277,6 +353,7 @@ class OnStepXMount:
                 write_timeout=2
             )
             time.sleep(2)  # Allow connection to stabilize
+            self._start_command_worker()
             
             # Test connection
             product = self.send_command(':GVP#')
@@ -302,6 +379,8 @@ class OnStepXMount:
     
     def disconnect(self):
         """Disconnect from mount"""
+        self._stop_command_worker()
+        
         if self.connection_type == 'network' and self.socket:
             try:
                 self.socket.close()
@@ -320,18 +399,333 @@ class OnStepXMount:
     
     def send_command(self, command):
         """Send command to mount and return response"""
-        if not self.is_connected:
+        responses = self.send_commands((command,))
+        return responses[0] if responses else None
+    
+    def send_commands(self, commands):
+        """
+        Send several commands to the mount as one request
+        
+        The commands are handed to the command worker together, so no other
+        caller's traffic is interleaved between them.
+        
+        Returns:
+            list: One response (or None) per command, or None if not connected
+        """
+        if self._command_worker is None:
             return None
         
-        with self.lock:
+        future = Future()
+        self._command_queue.put((tuple(commands), future))
+        try:
+            return future.result(timeout=self.COMMAND_TIMEOUT)
+        except Exception as e:
+            # The caller is told this failed, so it must never be sent later
+            future.cancel()
+            print(f"Command error: {e}")
+            return None
+    
+    # ========================================================================
+    # Command worker
+    # ========================================================================
+    
+    def _start_command_worker(self):
+        """Start the thread that owns the connection"""
+        self._command_queue = queue.Queue()
+        self._command_worker = Thread(
+            target=self._command_loop,
+            args=(self._command_queue,),
+            daemon=True
+        )
+        self._command_worker.start()
+    
+    def _stop_command_worker(self):
+        """Stop the command worker, failing any requests still queued"""
+        if self._command_worker is None:
+            return
+        
+        self._command_queue.put(None)
+        self._command_worker.join(timeout=self.COMMAND_TIMEOUT)
+        self._command_worker = None
+    
+    def _command_loop(self, command_queue):
+        """
+        Serve queued requests until stopped
+        
+        Each pass drains up to MAX_BATCH waiting requests. Runs of read-only
+        queries (:G...#) are pipelined - written in one burst and their
+        replies read back in order - everything else is sent one at a time.
+        When a pass starts with a query, the worker lingers PIPELINE_WINDOW
+        for concurrent pollers so their queries share the same write.
+        """
+        running = True
+        while running:
             try:
+                batch = [command_queue.get(timeout=self.KEEPALIVE_INTERVAL)]
+            except queue.Empty:
+                # Idle - keep NAT/router state for the link from expiring
                 if self.connection_type == 'network':
-                    return self._send_network(command)
-                elif self.connection_type == 'serial':
-                    return self._send_serial(command)
-            except Exception as e:
-                print(f"Command error: {e}")
-                return None
+                    self._send_network(':GVP#')
+                continue
+            if batch[0] is not None and self._is_query(batch[0][0]):
+                deadline = time.monotonic() + self.PIPELINE_WINDOW
+            else:
+                deadline = 0
+            
+            while batch[-1] is not None and len(batch) < self.MAX_BATCH:
+                try:
+                    remaining = deadline - time.monotonic()
+                    if remaining > 0:
+                        batch.append(command_queue.get(timeout=remaining))
+                    else:
+                        batch.append(command_queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            if batch[-1] is None:
+                batch.pop()
+                running = False
+            
+            pipeline = []
+            # Each request is claimed just before it is sent; one whose
+            # caller already timed out (and cancelled it) is dropped
+            for commands, future in batch:
+                if self._is_query(commands):
+                    if future.set_running_or_notify_cancel():
+                        pipeline.append((commands, future))
+                else:
+                    self._run_pipeline(pipeline)
+                    pipeline = []
+                    if future.set_running_or_notify_cancel():
+                        self._run_commands(commands, future)
+            self._run_pipeline(pipeline)
+        
+        # Fail anything queued behind the stop request
+        while True:
+            try:
+                item = command_queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None and item[1].set_running_or_notify_cancel():
+                item[1].set_result([None] * len(item[0]))
+    
+    @staticmethod
+    def _is_query(commands):
+        """Check if every command is a read-only :G query"""
+        return all(cmd.startswith(':G') for cmd in commands)
+    
+    def _run_commands(self, commands, future):
+        """
+        Send commands and resolve their future
+        
+        Leading commands with one-character replies (e.g. :Sr, :Sd, :MS) are
+        written in one burst together with the command after them, since
+        their replies can be split off by length; the rest go one at a time.
+        """
+        try:
+            short = 0
+            while short < len(commands) and commands[short].startswith(self.ONE_CHAR_REPLIES):
+                short += 1
+            
+            if short:
+                burst = commands[:short + 1]
+                responses = self._send_burst(burst, short)
+            else:
+                burst = ()
+                responses = []
+            responses += [self._send(cmd) for cmd in commands[len(burst):]]
+            future.set_result(responses)
+        except Exception as e:
+            future.set_exception(e)
+    
+    def _run_pipeline(self, requests):
+        """Write a run of queries in one burst and split the replies"""
+        if not requests:
+            return
+        
+        commands = [cmd for cmds, _ in requests for cmd in cmds]
+        if len(commands) == 1:
+            self._run_commands(*requests[0])
+            return
+        
+        try:
+            responses = self._send_pipelined(commands)
+        except Exception as e:
+            print(f"Command error: {e}")
+            responses = [None] * len(commands)
+        
+        index = 0
+        for cmds, future in requests:
+            future.set_result(responses[index:index + len(cmds)])
+            index += len(cmds)
+    
+    def _send(self, command):
+        """Send a single command on the active transport"""
+        if self.connection_type == 'network':
+            return self._send_network(command)
+        elif self.connection_type == 'serial':
+            return self._send_serial(command)
+        return None
+    
+    def _send_burst(self, commands, short):
+        """
+        Write one-character-reply commands (and optionally one more) at once
+        
+        Args:
+            commands: The short-reply commands, possibly followed by one other
+            short: Number of leading commands with one-character replies
+        
+        Returns:
+            list: Parsed responses in command order (None where missing)
+        """
+        payload = ''.join(commands).encode('ascii')
+        final = len(commands) > short
+        
+        if self.connection_type == 'network':
+            if not self.socket:
+                return [None] * len(commands)
+            acks, last = self._exchange_network(payload, lambda: (
+                self._read_network(short),
+                self._read_network() if final else b''))
+        else:
+            if not self.serial or not self.serial.is_open:
+                return [None] * len(commands)
+            self.serial.reset_input_buffer()
+            self.serial.write(payload)
+            acks = self.serial.read(short)
+            last = self.serial.read_until(b'#', self.MAX_REPLY) if final else b''
+        
+        responses = [chr(ack) for ack in acks]
+        responses += [None] * (short - len(responses))
+        if final:
+            responses.append(last.rstrip(b'#').decode('ascii').strip() or None)
+        return responses
+    
+    def _exchange_network(self, payload, read):
+        """
+        Write payload to the mount socket and return read()
+        
+        If the link has dropped (reset, broken pipe, closed by the mount),
+        the socket is reopened once and the exchange retried, rather than
+        failing until the client reconnects. Only a payload the mount can't
+        have acted on is resent - one that failed before any byte was
+        written, or pure :G queries - so a goto, sync or guide pulse the
+        mount already received never runs twice.
+        """
+        view = memoryview(payload)
+        for attempt in range(2):
+            sent = 0
+            try:
+                self._rx.clear()
+                while sent < len(view):
+                    sent += self.socket.send(view[sent:])
+                return read()
+            except OSError:
+                if attempt or (sent and not self._is_query_payload(payload)):
+                    raise
+                if not self._reopen_socket():
+                    raise
+    
+    @staticmethod
+    def _is_query_payload(payload):
+        """Check if every command in a raw payload is a read-only :G query"""
+        return all(cmd.startswith(b':G') for cmd in payload.split(b'#') if cmd)
+    
+    def _reopen_socket(self):
+        """Replace a dropped mount connection with a fresh one"""
+        print("⚠ Mount connection lost - reconnecting...")
+        try:
+            self.socket.close()
+        except OSError:
+            pass
+        try:
+            self.socket = self._open_socket()
+            self._mount_target = [None, None]
+            return True
+        except OSError as e:
+            print(f"✗ Reconnect failed: {e}")
+            return False
+    
+    @staticmethod
+    def _read_replies(expected, read_reply):
+        """Read up to `expected` replies, stopping at one without a '#'"""
+        replies = []
+        for _ in range(expected):
+            reply = read_reply()
+            replies.append(reply)
+            if not reply.endswith(b'#'):
+                break
+        return replies
+    
+    def _read_network(self, count=None):
+        """
+        Read one reply from the mount socket
+        
+        Bytes received beyond the reply stay in self._rx for the next read.
+        Gives up after REPLY_TIMEOUT seconds and returns whatever arrived.
+        
+        Args:
+            count: Exact reply length, or None to read through the next '#'
+        """
+        deadline = time.monotonic() + self.REPLY_TIMEOUT
+        while True:
+            if count is None:
+                end = self._rx.find(b'#') + 1
+            else:
+                end = count if len(self._rx) >= count else 0
+            if end:
+                break
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                end = len(self._rx)
+                break
+            self.socket.settimeout(remaining)
+            try:
+                received = self.socket.recv_into(self._rx_chunk)
+            except socket.timeout:
+                end = len(self._rx)
+                break
+            if not received:
+                raise ConnectionResetError("Mount closed the connection")
+            self._rx += self._rx_chunk[:received]
+        
+        reply = bytes(self._rx[:end])
+        del self._rx[:end]
+        return reply
+    
+    def _send_pipelined(self, commands):
+        """
+        Write several '#'-terminated queries at once and read all replies
+        
+        Replies are read one at a time, in order. If any comes back without
+        its '#' - e.g. OnStep's bare '0' for an unsupported command - it has
+        run into the next reply and every later value would land in the
+        wrong slot, so the queries are asked again one at a time instead.
+        
+        Returns:
+            list: Parsed responses in command order (None where missing)
+        """
+        payload = ''.join(commands).encode('ascii')
+        expected = len(commands)
+        
+        if self.connection_type == 'network':
+            if not self.socket:
+                return [None] * expected
+            replies = self._exchange_network(
+                payload, lambda: self._read_replies(expected, self._read_network))
+        else:
+            if not self.serial or not self.serial.is_open:
+                return [None] * expected
+            self.serial.reset_input_buffer()
+            self.serial.write(payload)
+            # Each read blocks (up to the port timeout) until a whole reply is in
+            replies = self._read_replies(
+                expected, lambda: self.serial.read_until(b'#', self.MAX_REPLY))
+        
+        if len(replies) < expected or not replies[-1].endswith(b'#'):
+            return [self._send(cmd) for cmd in commands]
+        return [reply.rstrip(b'#').decode('ascii').strip() or None for reply in replies]
     
     def _send_network(self, command):
         """Send command via network"""
@@ -339,22 +733,8 @@ class OnStepXMount:
             return None
         
         try:
-            # Send command
-            self.socket.sendall(command.encode('ascii'))
-            
-            # Receive response
-            response = b''
-            start_time = time.time()
-            while time.time() - start_time < 2:
-                try:
-                    chunk = self.socket.recv(1024)
-                    if not chunk:
-                        break
-                    response += chunk
-                    if b'#' in response:
-                        break
-                except socket.timeout:
-                    break
+            # Send command and receive response
+            response = self._exchange_network(command.encode('ascii'), self._read_network)
             
             # Parse response
             if response:
@@ -375,17 +755,12 @@ class OnStepXMount:
             self.serial.reset_input_buffer()
             self.serial.write(command.encode('ascii'))
             
-            response = b''
-            start_time = time.time()
-            while time.time() - start_time < 2:
-                if self.serial.in_waiting:
-                    byte = self.serial.read(1)
-                    if byte == b'#':
-                        break
-                    response += byte
+            # One buffered read up to the terminator; the port's 2 s timeout
+            # bounds replies that never end in '#'
+            response = self.serial.read_until(b'#', self.MAX_REPLY)
             
             if response:
-                return response.decode('ascii').strip()
+                return response.rstrip(b'#').decode('ascii').strip() or None
             return None
             
         except Exception as e:
@@ -395,15 +770,14 @@ class OnStepXMount:
     def _update_site_info(self):
         """Get site information from mount"""
         try:
-            # Get latitude
-            lat_str = self.send_command(':Gt#')
+            # Latitude and longitude only change through this driver, so
+            # they are read once here, pipelined into one round-trip
+            lat_str, lon_str = self.send_commands([':Gt#', ':Gg#']) or (None, None)
             if lat_str:
-                self.site_latitude = helpers.parse_degrees(lat_str)
+                self.site_latitude = helpers.parse_dec_to_degrees(lat_str)
             
-            # Get longitude
-            lon_str = self.send_command(':Gg#')
             if lon_str:
-                self.site_longitude = helpers.parse_degrees(lon_str)
+                self.site_longitude = helpers.parse_dec_to_degrees(lon_str)
             
         except Exception as e:
             print(f"Error updating site info: {e}")
@@ -414,7 +788,7 @@ class OnStepXMount:
             # Get meridian limits from OnStepX
             response = self.send_command(':Gh#')
             if response:
-                self.meridian_offset_east = helpers.parse_ra_hours(response) if response else 0.0
+                self.meridian_offset_east = helpers.parse_ra_to_hours(response) if response else 0.0
             
             # Some OnStepX versions have separate east/west offsets
             response = self.send_command(':GXE0#')
@@ -442,39 +816,96 @@ class OnStepXMount:
     # Position methods
     # ========================================================================
     
+    # Status queries fetched together by get_status_bundle()
+    STATUS_COMMANDS = (
+        ('ra', ':GR#'),
+        ('dec', ':GD#'),
+        ('alt', ':GA#'),
+        ('az', ':GZ#'),
+        ('lst', ':GS#'),
+        ('tracking', ':GT#'),
+        ('status', ':GU#'),
+        ('pier', ':Gm#'),
+    )
+    
+    @helpers.ttl_cache(POSITION_CACHE_TTL)
+    def get_status_bundle(self):
+        """
+        Read all polled status values from the mount in one batch
+        
+        The queries are written back to back and their '#'-terminated
+        replies split apart, so a client polling position, tracking, park
+        and pier side costs one round-trip instead of one per property.
+        
+        Returns:
+            dict: Raw mount responses keyed as in STATUS_COMMANDS
+                  (None where the mount did not answer)
+        """
+        responses = self.send_commands([cmd for _, cmd in self.STATUS_COMMANDS])
+        if not responses:
+            responses = [None] * len(self.STATUS_COMMANDS)
+        return {key: response for (key, _), response in zip(self.STATUS_COMMANDS, responses)}
+    
+    def get_state(self):
+        """
+        Get the commonly polled mount state from a single status bundle
+        
+        Returns:
+            dict: Alpaca property name -> value
+        """
+        return {
+            'RightAscension': self.get_right_ascension(),
+            'Declination': self.get_declination(),
+            'Altitude': self.get_altitude(),
+            'Azimuth': self.get_azimuth(),
+            'SiderealTime': self.get_sidereal_time(),
+            'Slewing': self.is_slewing(),
+            'Tracking': self.get_tracking(),
+            'AtPark': self.get_at_park(),
+            'AtHome': self.get_at_home(),
+            'SideOfPier': int(self.get_side_of_pier()),
+        }
+    
     def get_right_ascension(self):
         """Get current RA in hours"""
-        response = self.send_command(':GR#')
+        response = self.get_status_bundle()['ra']
         if response:
-            return helpers.parse_ra_hours(response)
+            return helpers.parse_ra_to_hours(response)
         return None
     
     def get_declination(self):
         """Get current Dec in degrees"""
-        response = self.send_command(':GD#')
+        response = self.get_status_bundle()['dec']
         if response:
-            return helpers.parse_degrees(response)
+            return helpers.parse_dec_to_degrees(response)
         return None
     
     def get_altitude(self):
         """Get current altitude in degrees"""
-        response = self.send_command(':GA#')
+        response = self.get_status_bundle()['alt']
         if response:
-            return helpers.parse_degrees(response)
+            return helpers.parse_dec_to_degrees(response)
         return 0.0
     
     def get_azimuth(self):
         """Get current azimuth in degrees"""
-        response = self.send_command(':GZ#')
+        response = self.get_status_bundle()['az']
         if response:
-            return helpers.parse_degrees(response)
+            return helpers.parse_dec_to_degrees(response)
         return 0.0
     
     def get_sidereal_time(self):
         """Get local sidereal time in hours"""
-        response = self.send_command(':GS#')
+        lst, read_at = self._lst_reading
+        now = time.monotonic()
+        if now - read_at < self.LST_CACHE_TTL:
+            return (lst + (now - read_at) * self.SIDEREAL_HOURS_PER_SECOND) % 24.0
+        
+        response = self.get_status_bundle()['lst']
         if response:
-            return helpers.parse_ra_hours(response)
+            lst = helpers.parse_ra_to_hours(response)
+            self._lst_reading = (lst, now)
+            return lst
         return None
     
     # ========================================================================
@@ -483,7 +914,7 @@ class OnStepXMount:
     
     def get_tracking(self):
         """Get tracking state"""
-        response = self.send_command(':GT#')
+        response = self.get_status_bundle()['tracking']
         return response != '0' if response else False
     
     def set_tracking(self, enabled):
@@ -492,16 +923,13 @@ class OnStepXMount:
             self.send_command(':Te#')
         else:
             self.send_command(':Td#')
+        self.get_status_bundle.cache_clear()
     
     def set_tracking_rate(self, rate):
         """Set tracking rate"""
-        rate_cmds = {
-            DriveRates.driveSidereal: ':TQ#',
-            DriveRates.driveLunar: ':TL#',
-            DriveRates.driveSolar: ':TS#',
-        }
-        if rate in rate_cmds:
-            self.send_command(rate_cmds[rate])
+        cmd = self.TRACKING_RATE_COMMANDS.get(rate)
+        if cmd is not None:
+            self.send_command(cmd)
             self.tracking_rate = rate
     
     def get_supported_tracking_rates(self):
@@ -534,6 +962,7 @@ class OnStepXMount:
         self._slew_start_time = time.time()
         self._position_stable_since = None
         self._last_position = None
+        self._invalidate_position_cache()
     
     def _clear_slew_state(self):
         """Clear slewing state tracking"""
@@ -542,22 +971,29 @@ class OnStepXMount:
         self._slew_start_time = None
         self._position_stable_since = None
         self._last_position = None
+        self._invalidate_position_cache()
+    
+    def _invalidate_position_cache(self):
+        """Drop cached position polls after the mount is moved or synced"""
+        self.get_status_bundle.cache_clear()
+        self.is_slewing.cache_clear()
     
+    @helpers.ttl_cache(POSITION_CACHE_TTL)
     def is_slewing(self):
         """
-        Enhanced slewing detection using position stability
+        Slewing detection from the mount status, with a position fallback
         
-        OnStepX doesn't provide reliable IsSlewing status, so we:
-        1. Track when we start a slew
-        2. Poll position to detect when we're close to target
-        3. Wait for position to stabilize (no movement for 2 seconds)
-        4. Consider slew complete when stable near target
+        While a slew we started is in progress:
+        1. Ask the :GU# status (already in the polled status bundle) -
+           'N' means no goto is running
+        2. If the mount gave no status, poll position until it is close to
+           target and has stopped moving for 2 seconds
         """
         if not self.is_connected:
             return False
         
-        # If no slew target was ever set, not slewing
-        if self._slew_target is None:
+        # If no slew was started, not slewing
+        if not self._slewing:
             return False
         
         # Check for timeout (safety)
@@ -568,6 +1004,18 @@ class OnStepXMount:
                 self._clear_slew_state()
                 return False
         
+        # The mount's own goto flag, when it reports one
+        status = self.get_status_bundle()['status']
+        if status:
+            if 'N' in status:
+                self._clear_slew_state()
+                return False
+            return True
+        
+        # Position fallback needs an RA/Dec target
+        if self._slew_target is None:
+            return False
+        
         # Get current position
         current_ra = self.get_right_ascension()
         current_dec = self.get_declination()
@@ -589,11 +1037,8 @@ class OnStepXMount:
         # Dec difference in arcminutes
         dec_diff = abs(current_dec - target_dec) * 60.0
         
-        # Total angular distance
-        total_distance = (ra_diff**2 + dec_diff**2)**0.5
-        
-        # Are we close to target?
-        if total_distance < self._stability_threshold:
+        # Are we close to target? (squared distances - no sqrt needed)
+        if ra_diff * ra_diff + dec_diff * dec_diff < self._stability_threshold_sq:
             # Close to target - check for stability
             
             if self._position_stable_since is None:
@@ -608,9 +1053,9 @@ class OnStepXMount:
                 
                 ra_movement = abs(current_ra - last_ra) * 15.0 * 60.0  # arcminutes
                 dec_movement = abs(current_dec - last_dec) * 60.0      # arcminutes
-                total_movement = (ra_movement**2 + dec_movement**2)**0.5
+                total_movement_sq = ra_movement * ra_movement + dec_movement * dec_movement
                 
-                if total_movement > 0.1:  # Moved more than 0.1 arcminutes (6 arcsec)
+                if total_movement_sq > 0.01:  # Moved more than 0.1 arcminutes (6 arcsec)
                     # Position is still changing - reset stability timer
                     self._position_stable_since = time.time()
                     self._last_position = (current_ra, current_dec)
@@ -630,15 +1075,56 @@ class OnStepXMount:
         # Still far from target - definitely slewing
         return True
     
+    def set_target_ra(self, ra_hours):
+        """Set target RA and load it into the mount"""
+        self.target_ra = ra_hours
+        ra_str = helpers.format_ra_hours(ra_hours)
+        if self.send_command(f':Sr{ra_str}#') == '1':
+            self._mount_target[0] = ra_hours
+        else:
+            self._mount_target[0] = None
+    
+    def set_target_dec(self, dec_degrees):
+        """Set target Dec and load it into the mount"""
+        self.target_dec = dec_degrees
+        dec_str = helpers.format_dec_degrees(dec_degrees).replace(':', '*')
+        if self.send_command(f':Sd{dec_str}#') == '1':
+            self._mount_target[1] = dec_degrees
+        else:
+            self._mount_target[1] = None
+    
+    def _target_loaded(self):
+        """Check if the mount already holds the current target"""
+        return self._mount_target == [self.target_ra, self.target_dec]
+    
+    def _record_target(self, ra_hours, dec_degrees, responses):
+        """Remember the target the mount holds after an :Sr/:Sd burst"""
+        if responses and responses[0] == '1' and responses[1] == '1':
+            self._mount_target = [ra_hours, dec_degrees]
+        else:
+            self._mount_target = [None, None]
+    
+    def slew_to_target(self):
+        """Slew to the current target, reusing the target held by the mount"""
+        if not self._target_loaded():
+            return self.slew_to_coords(self.target_ra, self.target_dec)
+        
+        response = self.send_command(':MS#')
+        if response == '0':
+            self._set_slew_target(self.target_ra, self.target_dec)
+            return True
+        else:
+            self._clear_slew_state()
+            return False
+    
     def slew_to_coords(self, ra_hours, dec_degrees):
         """Slew to RA/Dec coordinates"""
         ra_str = helpers.format_ra_hours(ra_hours)
         dec_str = helpers.format_dec_degrees(dec_degrees).replace(':', '*')
         
-        self.send_command(f':Sr{ra_str}#')
-        self.send_command(f':Sd{dec_str}#')
-        
-        response = self.send_command(':MS#')
+        responses = self.send_commands([f':Sr{ra_str}#', f':Sd{dec_str}#', ':MS#'])
+        self._record_target(ra_hours, dec_degrees, responses)
+        response = responses[-1] if responses else None
         
         if response == '0':
             # Slew started successfully - track target
@@ -654,15 +1140,16 @@ class OnStepXMount:
         az_str = helpers.format_dec_degrees(azimuth).replace(':', '*')
         alt_str = helpers.format_dec_degrees(altitude).replace(':', '*')
         
-        self.send_command(f':Sz{az_str}#')
-        self.send_command(f':Sa{alt_str}#')
-        
-        response = self.send_command(':MA#')
+        # The alt/az setters replace whatever RA/Dec target the mount held
+        self._mount_target = [None, None]
+        response = self.send_commands([f':Sz{az_str}#', f':Sa{alt_str}#', ':MA#'])
+        response = response[-1] if response else None
         
         if response == '0':
             # For Alt/Az slews, we don't have RA/Dec target
             self._slewing = True
             self._slew_start_time = time.time()
+            self._invalidate_position_cache()
             return True
         else:
             self._clear_slew_state()
@@ -691,10 +1178,19 @@ class OnStepXMount:
         ra_str = helpers.format_ra_hours(ra_hours)
         dec_str = helpers.format_dec_degrees(dec_degrees).replace(':', '*')
         
-        self.send_command(f':Sr{ra_str}#')
-        self.send_command(f':Sd{dec_str}#')
+        responses = self.send_commands([f':Sr{ra_str}#', f':Sd{dec_str}#', ':CM#'])
+        self._record_target(ra_hours, dec_degrees, responses)
+        response = responses[-1] if responses else None
+        self._invalidate_position_cache()
+        return response is not None
+    
+    def sync_to_target(self):
+        """Sync to the current target, reusing the target held by the mount"""
+        if not self._target_loaded():
+            return self.sync_to_coords(self.target_ra, self.target_dec)
         
         response = self.send_command(':CM#')
+        self._invalidate_position_cache()
         return response is not None
     
     def sync_to_altaz(self, azimuth, altitude):
@@ -702,9 +1198,9 @@ class OnStepXMount:
         az_str = helpers.format_dec_degrees(azimuth).replace(':', '*')
         alt_str = helpers.format_dec_degrees(altitude).replace(':', '*')
         
-        self.send_command(f':Sz{az_str}#')
-        self.send_command(f':Sa{alt_str}#')
-        self.send_command(':CM#')
+        self._mount_target = [None, None]
+        self.send_commands([f':Sz{az_str}#', f':Sa{alt_str}#', ':CM#'])
+        self._invalidate_position_cache()
     
     # ========================================================================
     # Park methods
@@ -717,27 +1213,30 @@ class OnStepXMount:
     
     def get_at_park(self):
         """Check if mount is at park position"""
-        response = self.send_command(':GU#')
+        response = self.get_status_bundle()['status']
         return response == 'P' if response else False
     
     def get_at_home(self):
         """Check if mount is at home position"""
-        response = self.send_command(':GU#')
+        response = self.get_status_bundle()['status']
         return response == 'H' if response else False
     
     def park(self):
         """Park the mount"""
         response = self.send_command(':hP#')
+        self._invalidate_position_cache()
         return response == '1'
     
     def unpark(self):
         """Unpark the mount"""
         response = self.send_command(':hR#')
+        self._invalidate_position_cache()
         return response == '1'
     
     def find_home(self):
         """Find home position"""
         response = self.send_command(':hF#')
+        self._invalidate_position_cache()
         return response == '1'
     
     def set_park_position(self):
@@ -751,7 +1250,7 @@ class OnStepXMount:
     def get_side_of_pier(self):
         """Get current side of pier"""
         try:
-            response = self.send_command(':Gm#')
+            response = self.get_status_bundle()['pier']
             if response:
                 if response.upper() == 'E':
                     return PierSide.pierEast
@@ -763,11 +1262,7 @@ class OnStepXMount:
             lst = self.get_sidereal_time()
             
             if ra is not None and lst is not None:
-                ha = lst - ra
-                while ha > 12.0:
-                    ha -= 24.0
-                while ha < -12.0:
-                    ha += 24.0
+                ha = (lst - ra + 12.0) % 24.0 - 12.0
                 
                 return PierSide.pierEast if ha < 0 else PierSide.pierWest
             
@@ -787,10 +1282,7 @@ class OnStepXMount:
             ha = lst - ra_hours
             
             # Normalize to -12 to +12 hours
-            while ha > 12.0:
-                ha -= 24.0
-            while ha < -12.0:
-                ha += 24.0
+            ha = (ha + 12.0) % 24.0 - 12.0
             
             # Apply meridian offsets from OnStepX configuration
             if ha < 0:
@@ -836,11 +1328,7 @@ class OnStepXMount:
         # Check hour angle limits
         lst = self.get_sidereal_time()
         if lst is not None:
-            ha = lst - ra_hours
-            while ha > 12.0:
-                ha -= 24.0
-            while ha < -12.0:
-                ha += 24.0
+            ha = (lst - ra_hours + 12.0) % 24.0 - 12.0
             
             max_ha_east = 12.0 + self.meridian_offset_east
             max_ha_west = self.meridian_offset_west
@@ -874,18 +1362,12 @@ class OnStepXMount:
     
     def pulse_guide(self, direction, duration_ms):
         """Pulse guide in specified direction"""
-        direction_cmds = {
-            GuideDirections.guideNorth: ':Mgn',
-            GuideDirections.guideSouth: ':Mgs',
-            GuideDirections.guideEast: ':Mge',
-            GuideDirections.guideWest: ':Mgw',
-        }
-        
-        if direction not in direction_cmds:
+        prefix = self.GUIDE_COMMANDS.get(direction)
+        if prefix is None:
             return False
         
         # Format duration (milliseconds)
-        cmd = f"{direction_cmds[direction]}{duration_ms:04d}#"
+        cmd = f"{prefix}{duration_ms:04d}#"
         
         # Send guide pulse command
         response = self.send_command(cmd)
@@ -1189,6 +1671,7 @@ class OnStepXMount:
         lon_str = helpers.format_dec_degrees(longitude).replace(':', '*')
         self.send_command(f':Sg{lon_str}#')
         self.site_longitude = longitude
+        self._lst_reading = (0.0, float('-inf'))  # LST depends on longitude
     
     # ========================================================================
     # Action() methods - OnStepX-specific commands
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""Test Alpaca routes in-process with the Flask test client (no server or hardware)"""
+
+import sys
+sys.path.insert(0, '..')
+
+import json
+import numpy as np
+import alpaca_helpers as helpers
+import config
+import main
+from test_mount_worker_py import FakeMount, STATUS_REPLIES, connect_fake
+
+client = main.app.test_client()
+
+class FakeCamera:
+    """Connected camera holding one 3 x 4 (height x width) frame"""
+    
+    def __init__(self):
+        self.is_connected = True
+        self.can_set_ccd_temperature = True
+        self.camera_state = 0
+        self.ccd_temperature = -10.0
+        self.cooler_power = 50.0
+        self.image_ready = True
+        self.percent_completed = 100
+        self.set_ccd_temperature = 0.0
+        self.frame = np.arange(12, dtype=np.uint16).reshape(3, 4)
+    
+    def get_image_buffer(self):
+        return self.frame
+    
+    def set_target_temperature(self, temp):
+        self.set_ccd_temperature = temp
+
+def attach_camera(camera):
+    """Install camera as device 0, returning the previous camera table"""
+    previous = main.app.cameras
+    main.app.cameras = (camera,)
+    return previous
+
+def attach_telescope(mount):
+    """Install mount as the telescope, returning the previous one"""
+    previous = main.telescope
+    main.telescope = main.app.telescope = mount
+    return previous
+
+def test_etag():
+    print("Testing ETag / If-None-Match...")
+    
+    r = client.get('/management/apiversions')
+    tag = r.headers['ETag']
+    assert r.status_code == 200, f"Expected 200, got {r.status_code}"
+    print(f"  ETag: {tag} ✓")
+    
+    r = client.get('/management/apiversions', headers={'If-None-Match': tag})
+    assert r.status_code == 304, f"Matching tag should give 304, got {r.status_code}"
+    print("  Single tag → 304 ✓")
+    
+    r = client.get('/management/apiversions', headers={'If-None-Match': f'"x", {tag}'})
+    assert r.status_code == 304, f"Tag in a list should give 304, got {r.status_code}"
+    print("  Tag list → 304 ✓")
+    
+    r = client.get('/management/apiversions', headers={'If-None-Match': '"other"'})
+    assert r.status_code == 200, f"Other tag should give 200, got {r.status_code}"
+    print("  Other tag → 200 ✓")
+    
+    print("✓ ETag OK\n")
+
+def test_image_formats():
+    print("Testing imagearray formats...")
+    
+    camera = FakeCamera()
+    previous = attach_camera(camera)
+    try:
+        r = client.get('/api/v1/camera/0/imagearray?ClientTransactionID=3000000000',
+                       headers={'Accept': helpers.IMAGEBYTES_MIMETYPE})
+        header = helpers.IMAGEBYTES_HEADER.unpack(r.data[:helpers.IMAGEBYTES_HEADER.size])
+        assert header[2] == 3000000000, f"ClientTransactionID should be UInt32, got {header[2]}"
+        assert header[8:10] == (4, 3), f"Dimensions should be width, height, got {header[8:10]}"
+        pixels = np.frombuffer(r.data[header[4]:], dtype='<u2').reshape(4, 3)
+        assert (pixels == camera.frame.T).all(), "ImageBytes pixels should be x-major"
+        print("  ImageBytes header and pixel order ✓")
+        
+        for client_id, wrapped in (('-1', 0xFFFFFFFF), ('4294967296', 0)):
+            r = client.get(f'/api/v1/camera/0/imagearray?ClientTransactionID={client_id}',
+                           headers={'Accept': helpers.IMAGEBYTES_MIMETYPE})
+            assert r.status_code == 200, f"ClientTransactionID={client_id} gave {r.status_code}"
+            header = helpers.IMAGEBYTES_HEADER.unpack(r.data[:helpers.IMAGEBYTES_HEADER.size])
+            assert header[2] == wrapped, f"Expected {wrapped}, got {header[2]}"
+        print("  Out-of-range ClientTransactionID wrapped ✓")
+        
+        ids = helpers._server_transaction_ids
+        helpers._server_transaction_ids = helpers.itertools.count(2 ** 32 + 5)
+        try:
+            r = client.get('/api/v1/camera/0/imagearray',
+                           headers={'Accept': helpers.IMAGEBYTES_MIMETYPE})
+            header = helpers.IMAGEBYTES_HEADER.unpack(r.data[:helpers.IMAGEBYTES_HEADER.size])
+            assert r.status_code == 200 and header[3] == 5, f"Server ID should wrap, got {header[3]}"
+        finally:
+            helpers._server_transaction_ids = ids
+        print("  ServerTransactionID past 2**32 wrapped ✓")
+        
+        r = client.get('/api/v1/camera/0/imagearray')
+        value = json.loads(r.data)['Value']
+        assert value == camera.frame.T.tolist(), "JSON Value should be indexed [x][y]"
+        assert value == pixels.tolist(), "JSON and ImageBytes should agree"
+        print("  Streamed JSON matches ImageBytes ✓")
+    finally:
+        main.app.cameras = previous
+    
+    print("✓ Image formats OK\n")
+
+def test_form_field_limit():
+    print("Testing PUT body field limit...")
+    
+    camera = FakeCamera()
+    previous = attach_camera(camera)
+    try:
+        r = client.put('/api/v1/camera/0/setccdtemperature',
+                       data={'SetCCDTemperature': '-5', 'ClientTransactionID': '7'})
+        assert r.status_code == 200 and camera.set_ccd_temperature == -5.0, "Small body should be parsed"
+        print("  Normal PUT parsed ✓")
+        
+        body = '&'.join(f'f{i}=1' for i in range(helpers.MAX_FORM_FIELDS + 1))
+        r = client.put('/api/v1/camera/0/setccdtemperature', data=body,
+                       content_type='application/x-www-form-urlencoded')
+        assert r.status_code == 400, f"Too many fields should give 400, got {r.status_code}"
+        print("  Oversized PUT rejected ✓")
+    finally:
+        main.app.cameras = previous
+    
+    print("✓ Field limit OK\n")
+
+def test_camera_write_busy():
+    print("Testing camera PUTs run one at a time...")
+    
+    camera = FakeCamera()
+    previous = attach_camera(camera)
+    timeout = helpers.CAMERA_WRITE_TIMEOUT
+    write_lock = helpers._camera_write_locks.setdefault(0, helpers.Lock())
+    helpers.CAMERA_WRITE_TIMEOUT = 0.1
+    write_lock.acquire()
+    try:
+        r = client.put('/api/v1/camera/0/setccdtemperature', data={'SetCCDTemperature': '-5'})
+        data = json.loads(r.data)
+        assert data['ErrorNumber'] == config.ASCOM_ERROR_CODES['INVALID_OPERATION'], \
+            f"Busy camera should give InvalidOperation, got {data['ErrorNumber']}"
+        assert camera.set_ccd_temperature == 0.0, "Busy PUT must not reach the camera"
+        print("  Concurrent PUT refused ✓")
+    finally:
+        write_lock.release()
+        helpers.CAMERA_WRITE_TIMEOUT = timeout
+        main.app.cameras = previous
+    
+    print("✓ Camera writes OK\n")
+
+def test_devicestate():
+    print("Testing devicestate...")
+    
+    previous_cameras = attach_camera(FakeCamera())
+    fake = FakeMount({**STATUS_REPLIES, ':GU#': b'NT#'})
+    mount = connect_fake(fake)
+    previous_telescope = attach_telescope(mount)
+    try:
+        r = client.get('/api/v1/camera/0/devicestate')
+        state = {item['Name']: item['Value'] for item in json.loads(r.data)['Value']}
+        assert state['CCDTemperature'] == -10.0 and 'TimeStamp' in state, f"Bad camera state: {state}"
+        print(f"  Camera: {sorted(state)} ✓")
+        
+        r = client.get('/api/v1/telescope/0/devicestate')
+        state = {item['Name']: item['Value'] for item in json.loads(r.data)['Value']}
+        assert state['RightAscension'] == 12.0, f"Bad RA: {state['RightAscension']}"
+        assert state['Slewing'] is False and state['SideOfPier'] == 1, f"Bad telescope state: {state}"
+        print(f"  Telescope: {sorted(state)} ✓")
+    finally:
+        mount.disconnect()
+        main.app.cameras = previous_cameras
+        attach_telescope(previous_telescope)
+    
+    print("✓ devicestate OK\n")
+
+def test_coordinate_validation():
+    print("Testing coordinate validation...")
+    
+    fake = FakeMount({':Sr': b'1', ':Sd': b'1', ':MS#': b'0', **STATUS_REPLIES, ':GU#': b'NT#'})
+    mount = connect_fake(fake)
+    previous = attach_telescope(mount)
+    invalid = config.ASCOM_ERROR_CODES['INVALID_VALUE']
+    try:
+        for ra in ('24', '-1', 'nan', 'inf'):
+            r = client.put('/api/v1/telescope/0/targetrightascension', data={'TargetRightAscension': ra})
+            assert json.loads(r.data)['ErrorNumber'] == invalid, f"RA={ra} should be rejected"
+        print("  RA 24, negative and non-finite rejected ✓")
+        
+        r = client.put('/api/v1/telescope/0/slewtoaltaz', data={'Azimuth': '360', 'Altitude': '45'})
+        assert json.loads(r.data)['ErrorNumber'] == invalid, "Azimuth=360 should be rejected"
+        print("  Azimuth 360 rejected ✓")
+        
+        r = client.put('/api/v1/telescope/0/targetrightascension', data={'TargetRightAscension': '23.5'})
+        assert json.loads(r.data)['ErrorNumber'] == 0, "RA=23.5 should be accepted"
+        assert any(cmd.startswith(':Sr') for cmd in fake.received), "Valid RA should reach the mount"
+        print("  RA 23.5 accepted ✓")
+    finally:
+        mount.disconnect()
+        attach_telescope(previous)
+    
+    print("✓ Coordinate validation OK\n")
+
+if __name__ == '__main__':
+    test_etag()
+    test_image_formats()
+    test_form_field_limit()
+    test_camera_write_busy()
+    test_devicestate()
+    test_coordinate_validation()
+    print("✅ Route tests PASSED\n")
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Test background focuser moves (Move/Halt/IsMoving) with the mock focuser"""
+
+import sys
+sys.path.insert(0, '..')
+
+import time
+from focuser import MockFocuser
+
+def wait_until_idle(foc, timeout=10.0):
+    """Poll is_moving() like a client would, up to timeout seconds"""
+    deadline = time.monotonic() + timeout
+    while foc.is_moving():
+        assert time.monotonic() < deadline, "Focuser never stopped moving"
+        time.sleep(0.02)
+
+def make_focuser():
+    foc = MockFocuser()
+    foc.connect()
+    return foc
+
+def test_latest_move_wins():
+    print("Testing rapid Moves end at the latest target...")
+    
+    for _ in range(5):
+        foc = make_focuser()
+        start = foc.current_position
+        for offset in (10, 100, 150, 180, 200):
+            foc.start_move(start + offset)
+        assert foc.is_moving(), "Queued moves should report moving"
+        wait_until_idle(foc)
+        assert foc.current_position == start + 200, \
+            f"Expected {start + 200}, ended at {foc.current_position}"
+    print("  Last Move wins ✓")
+    
+    print("✓ Rapid moves OK\n")
+
+def test_halt_during_backlash_move():
+    print("Testing Halt during a backlash move...")
+    
+    foc = make_focuser()
+    foc.set_backlash_compensation(50)
+    foc.last_direction = 'in'
+    start = foc.current_position
+    
+    # Direction changes to 'out': overshoot to start + 50, then approach start + 100
+    foc.start_move(start + 100)
+    time.sleep(0.1)
+    foc.halt()
+    wait_until_idle(foc)
+    
+    assert foc.current_position == start + 50, \
+        f"Halt should stop after the overshoot step, ended at {foc.current_position}"
+    assert foc.last_direction == 'in', "A halted move should not record its direction"
+    print("  Approach step skipped after Halt ✓")
+    
+    print("✓ Halt OK\n")
+
+if __name__ == '__main__':
+    test_latest_move_wins()
+    test_halt_during_backlash_move()
+    print("✅ Focuser moves PASSED\n")
@@ -4,6 +4,7 @@
 import sys
 sys.path.insert(0, '..')
 
+import time
 import alpaca_helpers as helpers
 
 def test_coordinate_parsing():
@@ -52,6 +53,18 @@ def test_validation():
     assert valid == False, "-10 should be invalid in range 0-100"
     print("  Range rejection (negative) ✓")
     
+    valid, msg = helpers.validate_range(24.0, 0, 24, "test", max_inclusive=False)
+    assert valid == False, "24 should be invalid in half-open range [0, 24)"
+    valid, msg = helpers.validate_range(23.99, 0, 24, "test", max_inclusive=False)
+    assert valid == True, "23.99 should be valid in half-open range [0, 24)"
+    print("  Half-open range ✓")
+    
+    valid, msg = helpers.validate_range(float('nan'), 0, 100, "test")
+    assert valid == False, "NaN should be rejected"
+    valid, msg = helpers.validate_range(float('inf'), 0, 100, "test")
+    assert valid == False, "Infinity should be rejected"
+    print("  Non-finite rejection ✓")
+    
     print("✓ Validation OK\n")
 
 def test_clamp():
@@ -79,9 +92,34 @@ def test_transaction_ids():
     
     print("✓ Transaction IDs OK\n")
 
+def test_ttl_cache():
+    print("Testing TTL cache...")
+    
+    calls = []
+    
+    @helpers.ttl_cache(0.2)
+    def read_value():
+        calls.append(1)
+        return len(calls)
+    
+    assert read_value() == 1, "First call should run the function"
+    assert read_value() == 1, "Second call should be served from cache"
+    print("  Cached within TTL ✓")
+    
+    time.sleep(0.25)
+    assert read_value() == 2, "Call after TTL should refresh"
+    print("  Refreshed after TTL ✓")
+    
+    read_value.cache_clear()
+    assert read_value() == 3, "Call after cache_clear should refresh"
+    print("  cache_clear forces refresh ✓")
+    
+    print("✓ TTL cache OK\n")
+
 if __name__ == '__main__':
     test_coordinate_parsing()
     test_validation()
     test_clamp()
     test_transaction_ids()
+    test_ttl_cache()
     print("✅ Helper functions PASSED\n")
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""Test the mount command worker against a fake OnStepX on a socketpair"""
+
+import sys
+sys.path.insert(0, '..')
+
+import socket
+import time
+from threading import Thread
+from telescope import OnStepXMount
+
+# Reply that makes the fake mount drop the connection instead of answering
+CLOSE = object()
+
+class FakeMount:
+    """
+    OnStepX stand-in on one end of a socketpair
+    
+    Replies are looked up by exact command first, then by command prefix
+    (e.g. ':Sr'); commands with no entry get no reply.
+    """
+    
+    def __init__(self, replies):
+        self.replies = dict(replies)
+        self.received = []
+        self.mount_side, self.driver_side = socket.socketpair()
+        Thread(target=self._serve, daemon=True).start()
+    
+    def _reply_for(self, command):
+        if command in self.replies:
+            return self.replies[command]
+        for prefix, reply in self.replies.items():
+            if command.startswith(prefix):
+                return reply
+        return None
+    
+    def _serve(self):
+        buffer = b''
+        while True:
+            try:
+                data = self.mount_side.recv(1024)
+            except OSError:
+                return
+            if not data:
+                return
+            buffer += data
+            while b'#' in buffer:
+                command, _, buffer = buffer.partition(b'#')
+                command = command.decode('ascii') + '#'
+                self.received.append(command)
+                reply = self._reply_for(command)
+                if reply is CLOSE:
+                    self.mount_side.close()
+                    return
+                if reply:
+                    self.mount_side.sendall(reply)
+
+def connect_fake(fake):
+    """Attach an OnStepXMount to a fake mount and start its command worker"""
+    mount = OnStepXMount(connection_type='network', host='fake-mount')
+    mount.REPLY_TIMEOUT = 0.3
+    mount.socket = fake.driver_side
+    mount._start_command_worker()
+    mount.is_connected = True
+    return mount
+
+STATUS_REPLIES = {
+    ':GR#': b'12:00:00#',
+    ':GD#': b'+45*00:00#',
+    ':GA#': b'+30*00:00#',
+    ':GZ#': b'180*00:00#',
+    ':GS#': b'06:00:00#',
+    ':GT#': b'60.1#',
+    ':Gm#': b'W#',
+}
+
+def test_command_round_trip():
+    print("Testing command worker round trip...")
+    
+    fake = FakeMount({':GVP#': b'On-Step#'})
+    mount = connect_fake(fake)
+    try:
+        assert mount.send_command(':GVP#') == 'On-Step', "Reply should come back parsed"
+        print("  Single command ✓")
+    finally:
+        mount.disconnect()
+    
+    print("✓ Command round trip OK\n")
+
+def test_timed_out_command_not_sent():
+    print("Testing timed-out commands are dropped...")
+    
+    fake = FakeMount({':MS#': b'0'})
+    mount = connect_fake(fake)
+    mount.COMMAND_TIMEOUT = 0.2
+    mount.REPLY_TIMEOUT = 1.0
+    try:
+        # A query the mount never answers keeps the worker busy
+        Thread(target=mount.send_command, args=(':GXX#',), daemon=True).start()
+        time.sleep(0.05)
+        
+        assert mount.send_command(':MS#') is None, "Timed-out command should report failure"
+        time.sleep(1.5)
+        assert ':MS#' not in fake.received, "Timed-out goto must never reach the mount"
+        print("  Goto dropped after caller timed out ✓")
+        
+        assert mount._command_worker.is_alive(), "Worker should survive a cancelled request"
+        print("  Worker still running ✓")
+    finally:
+        mount.disconnect()
+    
+    print("✓ Timed-out commands OK\n")
+
+def test_burst_replies():
+    print("Testing one-character reply burst...")
+    
+    fake = FakeMount({':Sr': b'1', ':Sd': b'1', ':MS#': b'0'})
+    mount = connect_fake(fake)
+    try:
+        responses = mount.send_commands([':Sr12:00:00#', ':Sd+45*00:00#', ':MS#'])
+        assert responses == ['1', '1', '0'], f"Unexpected burst replies: {responses}"
+        print(f"  Burst replies: {responses} ✓")
+    finally:
+        mount.disconnect()
+    
+    print("✓ Burst replies OK\n")
+
+def test_pipelined_replies():
+    print("Testing pipelined query replies...")
+    
+    # OnStep answers an unsupported command with a bare '0' (no '#')
+    fake = FakeMount({':GR#': b'12:00:00#', ':GXE9#': b'0',
+                      ':GD#': b'+45*00:00#', ':GU#': b'N#'})
+    mount = connect_fake(fake)
+    try:
+        responses = mount.send_commands([':GR#', ':GD#', ':GU#'])
+        assert responses == ['12:00:00', '+45*00:00', 'N'], f"Unexpected replies: {responses}"
+        print(f"  Pipelined replies: {responses} ✓")
+        
+        responses = mount.send_commands([':GR#', ':GXE9#', ':GD#', ':GU#'])
+        assert responses == ['12:00:00', '0', '+45*00:00', 'N'], f"Replies shifted: {responses}"
+        print(f"  Unterminated reply does not shift the rest: {responses} ✓")
+    finally:
+        mount.disconnect()
+    
+    print("✓ Pipelined replies OK\n")
+
+def test_reconnect():
+    print("Testing reconnect after a dropped link...")
+    
+    first = FakeMount({':GR#': CLOSE, ':MS#': CLOSE})
+    second = FakeMount({':GR#': b'12:00:00#', ':MS#': b'0'})
+    mount = connect_fake(first)
+    mount._open_socket = lambda: second.driver_side
+    try:
+        assert mount.send_command(':GR#') == '12:00:00', "Query should be resent after reconnect"
+        print("  Query resent on the new link ✓")
+    finally:
+        mount.disconnect()
+    
+    first = FakeMount({':MS#': CLOSE})
+    second = FakeMount({':MS#': b'0'})
+    mount = connect_fake(first)
+    mount._open_socket = lambda: second.driver_side
+    try:
+        assert mount.send_command(':MS#') is None, "Goto whose reply was lost should fail"
+        assert second.received == [], "Goto the mount already received must not be resent"
+        print("  Goto not resent ✓")
+    finally:
+        mount.disconnect()
+    
+    print("✓ Reconnect OK\n")
+
+def test_mount_target():
+    print("Testing loaded target bookkeeping...")
+    
+    fake = FakeMount({':Sr': b'0', ':Sd': b'1', ':MS#': b'0', ':Sz': b'1', ':Sa': b'1',
+                      ':MA#': b'0', **STATUS_REPLIES, ':GU#': b'n#'})
+    mount = connect_fake(fake)
+    try:
+        mount.slew_to_coords(1.0, 2.0)
+        assert mount._mount_target == [None, None], "Rejected :Sr should not count as loaded"
+        print("  Rejected setter not recorded ✓")
+        
+        fake.replies[':Sr'] = b'1'
+        mount.slew_to_coords(1.0, 2.0)
+        assert mount._mount_target == [1.0, 2.0], "Accepted target should be recorded"
+        print("  Accepted target recorded ✓")
+        
+        mount.slew_to_altaz(180.0, 45.0)
+        assert mount._mount_target == [None, None], "Alt/Az slew should forget the RA/Dec target"
+        print("  Alt/Az slew clears target ✓")
+    finally:
+        mount.disconnect()
+    
+    print("✓ Loaded target OK\n")
+
+def test_is_slewing_from_status():
+    print("Testing IsSlewing from :GU#...")
+    
+    fake = FakeMount({':Sr': b'1', ':Sd': b'1', ':MS#': b'0', **STATUS_REPLIES, ':GU#': b'nT#'})
+    mount = connect_fake(fake)
+    try:
+        assert mount.slew_to_coords(1.0, 2.0), "Slew should start"
+        assert mount.is_slewing(), "Status without 'N' should report slewing"
+        print("  Goto in progress ✓")
+        
+        fake.replies[':GU#'] = b'NT#'
+        mount._invalidate_position_cache()
+        assert not mount.is_slewing(), "'N' in status should end the slew"
+        print("  Goto finished ✓")
+    finally:
+        mount.disconnect()
+    
+    print("✓ IsSlewing OK\n")
+
+if __name__ == '__main__':
+    test_command_round_trip()
+    test_timed_out_command_not_sent()
+    test_burst_replies()
+    test_pipelined_replies()
+    test_reconnect()
+    test_mount_target()
+    test_is_slewing_from_status()
+    print("✅ Mount command worker PASSED\n")
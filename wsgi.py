@@ -0,0 +1,33 @@
+"""
+WSGI entry point for running the bridge under gunicorn
+
+    gunicorn -w 1 --threads 16 --worker-class gthread -b 0.0.0.0:5555 wsgi:app
+
+Keep a single worker: every process would try to open the mount's serial
+port and the camera/focuser SDKs, which only one process can own. Use
+--threads for concurrency instead.
+"""
+
+import atexit
+import logging
+
+import config
+from alpaca_discovery import AlpacaDiscovery
+from main import app, get_current_devices, init_devices, setup_logging
+
+logger = logging.getLogger(__name__)
+
+log_listener = setup_logging()
+atexit.register(log_listener.stop)
+
+init_devices()
+logger.info("Device initialization complete!")
+
+if config.ENABLE_DISCOVERY:
+    discovery = AlpacaDiscovery(
+        alpaca_port=config.SERVER_PORT,
+        server_info=config.SERVER_INFO,
+        get_devices_callback=get_current_devices
+    )
+    discovery.start()
+    atexit.register(discovery.stop)